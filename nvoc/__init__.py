@@ -20,9 +20,11 @@ from .nvml_controller import (
     SafetyLimitExceeded,
     GPUInfo,
     GPUStats,
+    GPUStatus,
     PowerLimits,
     ClockOffsets,
     SafetyLimits,
+    LIMITS,
 )
 
 from .profiles import (
@@ -48,9 +50,11 @@ __all__ = [
     "SafetyLimitExceeded",
     "GPUInfo",
     "GPUStats",
+    "GPUStatus",
     "PowerLimits",
     "ClockOffsets",
     "SafetyLimits",
+    "LIMITS",
     # Profiles
     "Profile",
     "ProfileManager",
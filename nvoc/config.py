@@ -6,9 +6,20 @@ Handles application settings and configuration.
 
 import json
 import logging
+import os
+from array import array
+from bisect import bisect_right
+import tempfile
+import threading
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass, asdict, field
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, field, replace
+from typing import Dict, Any, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json is the fallback
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +28,7 @@ CONFIG_FILE = CONFIG_DIR / "config.json"
 CRASH_FLAG_FILE = CONFIG_DIR / ".applying"  # Crash-safe flag file
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Application configuration."""
     
@@ -57,8 +68,29 @@ class AppConfig:
     })
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert config to dictionary."""
-        return asdict(self)
+        """Convert config to dictionary.
+        
+        The fan curve is shared with the config, not copied; treat the
+        result as read-only.
+        """
+        return {
+            "dark_mode": self.dark_mode,
+            "window_width": self.window_width,
+            "window_height": self.window_height,
+            "monitoring_interval_ms": self.monitoring_interval_ms,
+            "apply_default_profile_on_start": self.apply_default_profile_on_start,
+            "boot_profile_name": self.boot_profile_name,
+            "minimize_to_tray": self.minimize_to_tray,
+            "start_minimized": self.start_minimized,
+            "max_core_offset_mhz": self.max_core_offset_mhz,
+            "max_memory_offset_mhz": self.max_memory_offset_mhz,
+            "min_fan_speed_percent": self.min_fan_speed_percent,
+            "warning_temp_celsius": self.warning_temp_celsius,
+            "critical_temp_celsius": self.critical_temp_celsius,
+            "fan_hysteresis_celsius": self.fan_hysteresis_celsius,
+            "fan_ramp_step_percent": self.fan_ramp_step_percent,
+            "default_fan_curve": self.default_fan_curve,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AppConfig":
@@ -85,52 +117,184 @@ class AppConfig:
         )
 
 
+def build_fan_curve_points(curve: Dict[int, int]) -> Tuple[array, array]:
+    """
+    Convert a temp -> fan speed mapping into sorted parallel arrays.
+    
+    Keys may be strings when the curve was loaded from JSON.
+    """
+    points = sorted((int(t), int(s)) for t, s in curve.items())
+    return array('i', [t for t, _ in points]), array('i', [s for _, s in points])
+
+
+def interpolate_fan_speed(points: Tuple[array, array], temp: float) -> float:
+    """
+    Linearly interpolate a fan speed from curve points.
+    
+    Temperatures outside the curve clamp to the first/last point.
+    """
+    temps, speeds = points
+    if temp <= temps[0]:
+        return speeds[0]
+    if temp >= temps[-1]:
+        return speeds[-1]
+    i = bisect_right(temps, temp)
+    t1, t2 = temps[i - 1], temps[i]
+    s1, s2 = speeds[i - 1], speeds[i]
+    return s1 + (s2 - s1) * (temp - t1) / (t2 - t1)
+
+
+@lru_cache(maxsize=4)
+def _parse_config_blob(blob: bytes) -> AppConfig:
+    """Parse config file contents, memoized on the raw bytes."""
+    data = orjson.loads(blob) if orjson is not None else json.loads(blob)
+    return AppConfig.from_dict(data)
+
+
+# Directories already created by _ensure_config_dir() in this process
+_ready_dirs: Set[Path] = set()
+
+
+def _ensure_config_dir(directory: Path = CONFIG_DIR) -> None:
+    """Create a config directory once; later calls skip the mkdir syscalls."""
+    if directory in _ready_dirs:
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    _ready_dirs.add(directory)
+
+
+def _dump_config_blob(data: Dict[str, Any]) -> bytes:
+    """Serialize a config dict to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(data, indent=2, sort_keys=True).encode()
+
+
 class ConfigManager:
     """Manages application configuration."""
     
     def __init__(self, config_file: Optional[Path] = None):
         self.config_file = config_file or CONFIG_FILE
         self._config: Optional[AppConfig] = None
+        self._lock = threading.Lock()
+        self._pending: Optional[AppConfig] = None
+        self._pending_source: Optional[int] = None
     
     @property
     def config(self) -> AppConfig:
-        """Get current configuration, loading from file if needed."""
-        if self._config is None:
-            self._config = self.load()
-        return self._config
+        """Get current configuration, loading from file once per process."""
+        config = self._config
+        if config is None:
+            with self._lock:
+                # Re-check under the lock so only one thread reads the file
+                if self._config is None:
+                    self._config = self.load()
+                config = self._config
+        return config
+    
+    def invalidate(self) -> None:
+        """Drop the cached configuration so the next access re-reads the file."""
+        with self._lock:
+            self._config = None
     
     def load(self) -> AppConfig:
         """Load configuration from file."""
-        if not self.config_file.exists():
+        try:
+            cached = _parse_config_blob(self.config_file.read_bytes())
+            # Hand out a private copy; callers mutate the config in place
+            return replace(cached, default_fan_curve=dict(cached.default_fan_curve))
+        except FileNotFoundError:
             logger.info("No config file found, using defaults")
             return AppConfig()
-        
-        try:
-            with open(self.config_file, 'r') as f:
-                data = json.load(f)
-            return AppConfig.from_dict(data)
-        except (json.JSONDecodeError, IOError) as e:
+        except (json.JSONDecodeError, IOError) as e:  # orjson's error subclasses json's
             logger.warning(f"Failed to load config: {e}, using defaults")
             return AppConfig()
     
-    def save(self, config: Optional[AppConfig] = None) -> bool:
-        """Save configuration to file."""
+    def save(self, config: Optional[AppConfig] = None, durable: bool = False) -> bool:
+        """Save configuration to file.
+        
+        The file is written to a temporary sibling and renamed into place,
+        so a crash mid-save never leaves a truncated config behind.
+        
+        Args:
+            config: Configuration to store (defaults to the cached one)
+            durable: fsync the data before the rename (for boot-critical writes)
+        
+        Returns:
+            True if saved successfully
+        """
         if config is not None:
             self._config = config
         
         if self._config is None:
             return False
         
+        tmp_path = None
         try:
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, 'w') as f:
-                json.dump(self._config.to_dict(), f, indent=2)
+            blob = _dump_config_blob(self._config.to_dict())
+            _ensure_config_dir(self.config_file.parent)
+            with tempfile.NamedTemporaryFile(
+                dir=self.config_file.parent, prefix=".config-", delete=False
+            ) as f:
+                tmp_path = f.name
+                f.write(blob)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_file)
             logger.info("Configuration saved")
             return True
-        except IOError as e:
+        except (IOError, TypeError) as e:
             logger.error(f"Failed to save config: {e}")
+            _ready_dirs.discard(self.config_file.parent)  # Re-check next time
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
             return False
     
+    def save_debounced(self, config: Optional[AppConfig] = None, delay_ms: int = 500) -> None:
+        """Schedule a save, coalescing repeated calls within delay_ms into one write.
+        
+        Must be called from the GLib main loop. Every call restarts the timer,
+        so a burst of changes (e.g. dragging a control) results in a single write.
+        """
+        from gi.repository import GLib
+        
+        if config is not None:
+            self._config = config
+        self._pending = self._config
+        
+        if self._pending_source is not None:
+            GLib.source_remove(self._pending_source)
+        self._pending_source = GLib.timeout_add(delay_ms, self._on_debounce_timeout)
+    
+    def _on_debounce_timeout(self) -> bool:
+        """Timer callback for save_debounced()."""
+        self._pending_source = None
+        self.flush()
+        return False  # One-shot
+    
+    def flush(self) -> bool:
+        """Write any pending debounced save immediately.
+        
+        Returns:
+            True if nothing was pending or the save succeeded
+        """
+        if self._pending_source is not None:
+            from gi.repository import GLib
+            GLib.source_remove(self._pending_source)
+            self._pending_source = None
+        
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return True
+        return self.save(pending)
+    
     def reset_to_defaults(self) -> AppConfig:
         """Reset configuration to defaults."""
         self._config = AppConfig()
@@ -138,16 +302,14 @@ class ConfigManager:
         return self._config
 
 
-# Global config manager instance
-_config_manager: Optional[ConfigManager] = None
+@lru_cache(maxsize=1)
+def get_config_manager() -> ConfigManager:
+    """Get the global config manager instance (created on first use)."""
+    return ConfigManager()
 
 
-def get_config_manager() -> ConfigManager:
-    """Get the global config manager instance."""
-    global _config_manager
-    if _config_manager is None:
-        _config_manager = ConfigManager()
-    return _config_manager
+# Drop the global manager so the next get_config_manager() builds a fresh one
+reset_config_manager = get_config_manager.cache_clear
 
 
 def get_config() -> AppConfig:
@@ -155,30 +317,61 @@ def get_config() -> AppConfig:
     return get_config_manager().config
 
 
-def save_config(config: AppConfig = None) -> bool:
+def save_config(config: AppConfig = None, durable: bool = False) -> bool:
     """Save the current application configuration."""
-    return get_config_manager().save(config)
+    return get_config_manager().save(config, durable=durable)
 
 
 # Crash-Safe Fallback Functions
-def set_applying_flag() -> None:
-    """Set flag indicating settings are being applied (for crash detection)."""
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory entry change to disk (best effort)."""
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # Not supported by every filesystem
+    finally:
+        os.close(fd)
+
+
+def set_applying_flag(durable: bool = True) -> None:
+    """Set flag indicating settings are being applied (for crash detection).
+    
+    With durable=True the flag is fsynced together with its directory entry,
+    so it survives a power loss during the apply.
+    """
     try:
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        CRASH_FLAG_FILE.touch()
+        _ensure_config_dir()
+        fd = os.open(CRASH_FLAG_FILE, os.O_CREAT | os.O_WRONLY, 0o644)
+        try:
+            if durable:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        if durable:
+            _fsync_dir(CONFIG_DIR)
         logger.debug("Applying flag set")
     except IOError as e:
+        _ready_dirs.discard(CONFIG_DIR)
         logger.warning(f"Failed to set applying flag: {e}")
 
 
-def clear_applying_flag() -> None:
+def clear_applying_flag(durable: bool = True) -> None:
     """Clear the applying flag after successful apply."""
     try:
-        if CRASH_FLAG_FILE.exists():
-            CRASH_FLAG_FILE.unlink()
-            logger.debug("Applying flag cleared")
+        os.unlink(CRASH_FLAG_FILE)
+    except FileNotFoundError:
+        return
     except IOError as e:
         logger.warning(f"Failed to clear applying flag: {e}")
+        return
+    
+    if durable:
+        _fsync_dir(CONFIG_DIR)
+    logger.debug("Applying flag cleared")
 
 
 def check_crash_recovery() -> bool:
@@ -187,13 +380,13 @@ def check_crash_recovery() -> bool:
     Returns:
         True if crash detected (flag file exists), False otherwise.
     """
-    if CRASH_FLAG_FILE.exists():
-        logger.warning("Crash flag detected! Previous apply may have failed.")
-        # Clean up the flag
-        try:
-            CRASH_FLAG_FILE.unlink()
-        except IOError:
-            pass
-        return True
-    return False
-
+    # Removing the flag doubles as the existence check (one syscall)
+    try:
+        os.unlink(CRASH_FLAG_FILE)
+    except FileNotFoundError:
+        return False
+    except IOError:
+        pass  # Flag exists but could not be removed; still a crash
+    
+    logger.warning("Crash flag detected! Previous apply may have failed.")
+    return True
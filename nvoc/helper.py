@@ -11,30 +11,62 @@ Usage:
 Commands:
     status                  - Get GPU status (JSON output)
     set-power-limit <watts> - Set power limit
-    set-clock-offsets <core> <mem> - Set clock offsets
+    set-clock-offsets <core> <mem> - Set clock offsets ("null" = unchanged)
     set-fan-speed <percent> [fan_idx] - Set fan speed
     set-fan-auto [fan_idx]  - Set fan to auto mode
+    set-all-fans-speed <percent> - Set every fan's speed
+    set-all-fans-auto       - Set every fan to auto mode
     apply-profile <json>    - Apply a complete profile
+    serve [socket_path]     - Run as a daemon on a Unix socket
 """
 
 import sys
 import json
 import logging
-from typing import Dict, Any
+import signal
+import socket
+import socketserver
+import struct
+import threading
+from typing import Dict, Any, List, Optional
 
 # Add parent directory to path for imports
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from nvoc.nvml_controller import NVMLController, SafetyLimits
+from nvoc.nvml_controller import NVMLController, NVMLError
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json is the fallback
+    orjson = None
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+# Default socket for the ``serve`` daemon when not started for a user
+SOCKET_PATH = "/run/nvoc.sock"
+
+# Daemon frames are a 4-byte big-endian length followed by that much JSON
+FRAME_HEADER = struct.Struct(">I")
+MAX_FRAME_BYTES = 1 << 20
+
+# struct ucred returned by SO_PEERCRED: pid, uid, gid
+_PEERCRED = struct.Struct("3i")
+
+
+def dump_json(data: Dict[str, Any]) -> bytes:
+    """Serialize a response to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
 
 def output_json(data: Dict[str, Any]) -> None:
     """Output JSON result to stdout."""
-    print(json.dumps(data))
+    sys.stdout.flush()  # Keep ordering with any text already printed
+    sys.stdout.buffer.write(dump_json(data) + b"\n")
+    sys.stdout.buffer.flush()
 
 
 def output_error(message: str) -> None:
@@ -45,156 +77,323 @@ def output_error(message: str) -> None:
 
 def output_success(data: Dict[str, Any] = None) -> None:
     """Output success result."""
-    result = {"success": True}
-    if data:
-        result.update(data)
-    output_json(result)
+    output_json({"success": True, **data} if data else {"success": True})
 
 
-def cmd_status() -> None:
+class UsageError(Exception):
+    """Raised when a command is called with missing or malformed arguments."""
+    pass
+
+
+def cmd_status(ctrl: NVMLController) -> Dict[str, Any]:
     """Get GPU status."""
-    with NVMLController() as ctrl:
-        info = ctrl.get_gpu_info()
-        stats = ctrl.get_gpu_stats()
-        power = ctrl.get_power_limits()
-        offsets = ctrl.get_clock_offsets()
-        
-        output_success({
-            "gpu": {
-                "name": info.name,
-                "driver": info.driver_version,
-                "vbios": info.vbios_version,
-                "vram_total_mb": info.memory_total_mb,
-            },
-            "stats": {
-                "temperature": stats.temperature_celsius,
-                "fan_speed": stats.fan_speed_percent,
-                "power_draw": stats.power_draw_watts,
-                "power_limit": stats.power_limit_watts,
-                "core_clock": stats.core_clock_mhz,
-                "memory_clock": stats.memory_clock_mhz,
-                "gpu_util": stats.gpu_utilization_percent,
-                "mem_util": stats.memory_utilization_percent,
-                "vram_used_mb": stats.memory_used_mb,
-                "effective_core_clock": stats.effective_core_clock_mhz,
-                "effective_memory_clock": stats.effective_memory_clock_mhz,
-                "throttle_reasons": stats.throttle_reasons,
-                "peak_core_clock": stats.peak_core_clock_mhz,
-                "avg_core_clock": stats.avg_core_clock_mhz,
-                "pcie_gen": stats.pcie_gen,
-                "pcie_width": stats.pcie_width,
-                "pcie_gen_max": stats.pcie_gen_max,
-                "pcie_width_max": stats.pcie_width_max,
-                "thermal_threshold": stats.thermal_threshold_celsius,
-                "thermal_headroom": stats.thermal_headroom_celsius,
-                "power_limit_active": stats.power_limit_active,
-                "memory_errors": stats.memory_errors,
-            },
-            "power_limits": {
-                "current": power.current_watts,
-                "min": power.min_watts,
-                "max": power.max_watts,
-                "default": power.default_watts,
-            },
-            "offsets": {
-                "core": offsets.core_offset_mhz,
-                "memory": offsets.memory_offset_mhz,
-            },
-            "safety_limits": {
-                "max_core_offset": SafetyLimits.MAX_CORE_CLOCK_OFFSET_MHZ,
-                "max_memory_offset": SafetyLimits.MAX_MEMORY_CLOCK_OFFSET_MHZ,
-                "min_fan_speed": SafetyLimits.MIN_FAN_SPEED_PERCENT,
-            }
-        })
-
-
-def cmd_set_power_limit(watts: float) -> None:
+    return ctrl.get_status_bundle()
+
+
+def cmd_set_power_limit(ctrl: NVMLController, watts: float) -> Dict[str, Any]:
     """Set power limit."""
-    with NVMLController() as ctrl:
-        ctrl.set_power_limit(watts)
-        output_success({"power_limit": watts})
+    ctrl.set_power_limit(watts)
+    return {"power_limit": watts}
 
 
-def cmd_set_clock_offsets(core: int, mem: int) -> None:
-    """Set clock offsets."""
-    with NVMLController() as ctrl:
-        actual_core, actual_mem = ctrl.set_clock_offsets(
-            core_offset_mhz=core,
-            memory_offset_mhz=mem
-        )
-        output_success({
-            "core_offset": actual_core,
-            "memory_offset": actual_mem
-        })
+def _parse_offset(arg: str) -> Optional[int]:
+    """Parse a clock offset argument; "null" means leave it unchanged."""
+    return None if arg == "null" else int(arg)
 
 
-def cmd_set_locked_clocks(min_mhz: int, max_mhz: int) -> None:
+def cmd_set_clock_offsets(ctrl: NVMLController, core: Optional[int],
+                          mem: Optional[int]) -> Dict[str, Any]:
+    """Set clock offsets (None leaves that offset unchanged)."""
+    actual_core, actual_mem = ctrl.set_clock_offsets(
+        core_offset_mhz=core,
+        memory_offset_mhz=mem
+    )
+    return {
+        "core_offset": actual_core,
+        "memory_offset": actual_mem
+    }
+
+
+def cmd_set_locked_clocks(ctrl: NVMLController, min_mhz: int, max_mhz: int) -> Dict[str, Any]:
     """Set locked clocks."""
-    with NVMLController() as ctrl:
-        ctrl.set_gpu_locked_clocks(min_mhz, max_mhz)
-        output_success({"min_mhz": min_mhz, "max_mhz": max_mhz})
+    ctrl.set_gpu_locked_clocks(min_mhz, max_mhz)
+    return {"min_mhz": min_mhz, "max_mhz": max_mhz}
 
 
-def cmd_reset_clocks() -> None:
+def cmd_reset_clocks(ctrl: NVMLController) -> Dict[str, Any]:
     """Reset clock offsets to zero."""
-    with NVMLController() as ctrl:
-        ctrl.reset_clock_offsets()
-        output_success()
+    ctrl.reset_clock_offsets()
+    return {}
 
 
-def cmd_set_fan_speed(percent: int, fan_idx: int = 0) -> None:
+def cmd_set_fan_speed(ctrl: NVMLController, percent: int, fan_idx: int = 0) -> Dict[str, Any]:
     """Set fan speed."""
-    with NVMLController() as ctrl:
-        actual = ctrl.set_fan_speed(percent, fan_index=fan_idx)
-        output_success({"fan_speed": actual, "fan_index": fan_idx})
+    actual = ctrl.set_fan_speed(percent, fan_index=fan_idx)
+    return {"fan_speed": actual, "fan_index": fan_idx}
 
 
-def cmd_set_fan_auto(fan_idx: int = 0) -> None:
+def cmd_set_fan_auto(ctrl: NVMLController, fan_idx: int = 0) -> Dict[str, Any]:
     """Set fan to auto mode."""
-    with NVMLController() as ctrl:
-        ctrl.set_fan_auto(fan_index=fan_idx)
-        output_success({"fan_index": fan_idx, "mode": "auto"})
+    ctrl.set_fan_auto(fan_index=fan_idx)
+    return {"fan_index": fan_idx, "mode": "auto"}
 
 
-def cmd_apply_profile(profile_json: str) -> None:
+def cmd_set_all_fans_speed(ctrl: NVMLController, percent: int) -> Dict[str, Any]:
+    """Set every fan to the same speed."""
+    actual = ctrl.set_all_fans_speed(percent)
+    return {"fan_count": ctrl.get_fan_count(), "fan_speed": actual}
+
+
+def cmd_set_all_fans_auto(ctrl: NVMLController) -> Dict[str, Any]:
+    """Set every fan to auto mode."""
+    ctrl.set_all_fans_auto()
+    return {"fan_count": ctrl.get_fan_count(), "mode": "auto"}
+
+
+def cmd_apply_profile(ctrl: NVMLController, profile_json: str) -> Dict[str, Any]:
     """Apply a complete profile from JSON."""
     try:
         profile = json.loads(profile_json)
     except json.JSONDecodeError as e:
-        output_error(f"Invalid JSON: {e}")
-        return
+        raise UsageError(f"Invalid JSON: {e}")
     
-    with NVMLController() as ctrl:
-        results = {}
-        
-        # Apply power limit
-        if "power_limit_watts" in profile and profile["power_limit_watts"] is not None:
-            ctrl.set_power_limit(profile["power_limit_watts"])
-            results["power_limit"] = profile["power_limit_watts"]
-        
-        # Apply clock offsets
-        core = profile.get("core_clock_offset_mhz")
-        mem = profile.get("memory_clock_offset_mhz")
-        if core is not None or mem is not None:
-            actual_core, actual_mem = ctrl.set_clock_offsets(
-                core_offset_mhz=core,
-                memory_offset_mhz=mem
-            )
-            results["core_offset"] = actual_core
-            results["memory_offset"] = actual_mem
-        
-        # Apply fan settings
-        fan_mode = profile.get("fan_mode", "auto")
-        if fan_mode == "auto":
-            ctrl.set_all_fans_auto()
-            results["fan_mode"] = "auto"
-        elif fan_mode == "manual":
-            speed = profile.get("fan_speed_percent", 50)
-            ctrl.set_all_fans_speed(speed)
-            results["fan_mode"] = "manual"
-            results["fan_speed"] = speed
+    # Clamp all fields up front so out-of-range values are reported together
+    profile = ctrl.clamp_settings(profile)
+    results = {}
+    
+    # Apply power limit
+    if "power_limit_watts" in profile and profile["power_limit_watts"] is not None:
+        ctrl.set_power_limit(profile["power_limit_watts"])
+        results["power_limit"] = profile["power_limit_watts"]
+    
+    # Apply clock offsets
+    core = profile.get("core_clock_offset_mhz")
+    mem = profile.get("memory_clock_offset_mhz")
+    if core is not None or mem is not None:
+        actual_core, actual_mem = ctrl.set_clock_offsets(
+            core_offset_mhz=core,
+            memory_offset_mhz=mem
+        )
+        results["core_offset"] = actual_core
+        results["memory_offset"] = actual_mem
+    
+    # Apply frequency lock (a present-but-empty value resets it)
+    if "max_clock_mhz" in profile:
+        max_clock = max(profile["max_clock_mhz"] or 0, 0)
+        ctrl.set_gpu_locked_clocks(0, max_clock)
+        results["max_clock"] = max_clock
+    
+    # Apply fan settings
+    fan_mode = profile.get("fan_mode", "auto")
+    if fan_mode == "auto":
+        ctrl.set_all_fans_auto()
+        results["fan_mode"] = "auto"
+    elif fan_mode == "manual":
+        speed = profile.get("fan_speed_percent", 50)
+        if speed is not None:
+            results["fan_speed"] = ctrl.set_all_fans_speed(speed)
+        results["fan_mode"] = "manual"
+    
+    return results
+
+
+def dispatch(ctrl: NVMLController, command: str, args: List[str]) -> Dict[str, Any]:
+    """
+    Run a GPU command against an open controller.
+    
+    Shared by the one-shot CLI and the ``serve`` daemon.
+    
+    Raises:
+        UsageError: If the command is unknown or its arguments are invalid
+    """
+    if command == "status":
+        return cmd_status(ctrl)
+    
+    elif command == "set-power-limit":
+        if len(args) < 1:
+            raise UsageError("Usage: set-power-limit <watts>")
+        return cmd_set_power_limit(ctrl, float(args[0]))
+    
+    elif command == "set-clock-offsets":
+        if len(args) < 2:
+            raise UsageError("Usage: set-clock-offsets <core_mhz> <mem_mhz>")
+        return cmd_set_clock_offsets(ctrl, _parse_offset(args[0]), _parse_offset(args[1]))
+    
+    elif command == "set-locked-clocks":
+        if len(args) < 2:
+            raise UsageError("Usage: set-locked-clocks <min_mhz> <max_mhz>")
+        return cmd_set_locked_clocks(ctrl, int(args[0]), int(args[1]))
+    
+    elif command == "reset-clocks":
+        return cmd_reset_clocks(ctrl)
+    
+    elif command == "set-fan-speed":
+        if len(args) < 1:
+            raise UsageError("Usage: set-fan-speed <percent> [fan_idx]")
+        fan_idx = int(args[1]) if len(args) > 1 else 0
+        return cmd_set_fan_speed(ctrl, int(args[0]), fan_idx)
+    
+    elif command == "set-fan-auto":
+        fan_idx = int(args[0]) if len(args) > 0 else 0
+        return cmd_set_fan_auto(ctrl, fan_idx)
+    
+    elif command == "set-all-fans-speed":
+        if len(args) < 1:
+            raise UsageError("Usage: set-all-fans-speed <percent>")
+        return cmd_set_all_fans_speed(ctrl, int(args[0]))
+    
+    elif command == "set-all-fans-auto":
+        return cmd_set_all_fans_auto(ctrl)
+    
+    elif command == "apply-profile":
+        if len(args) < 1:
+            raise UsageError("Usage: apply-profile <json>")
+        return cmd_apply_profile(ctrl, args[0])
+    
+    raise UsageError(f"Unknown command: {command}")
+
+
+# Commands handled by dispatch()
+GPU_COMMANDS = frozenset({
+    "status", "set-power-limit", "set-clock-offsets", "set-locked-clocks",
+    "reset-clocks", "set-fan-speed", "set-fan-auto", "set-all-fans-speed",
+    "set-all-fans-auto", "apply-profile",
+})
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handles length-prefixed JSON requests on a daemon connection."""
+    
+    def handle(self) -> None:
+        creds = self.request.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _PEERCRED.size)
+        _, uid, _ = _PEERCRED.unpack(creds)
+        if uid not in self.server.allowed_uids:
+            logger.warning(f"Rejected daemon connection from uid {uid}")
+            return
         
-        output_success(results)
+        # A client keeps its connection open and sends many requests
+        while True:
+            header = self.rfile.read(FRAME_HEADER.size)
+            if len(header) < FRAME_HEADER.size:
+                return  # Client disconnected
+            (length,) = FRAME_HEADER.unpack(header)
+            if length > MAX_FRAME_BYTES:
+                logger.warning(f"Dropping connection: {length}-byte frame")
+                return
+            
+            stop = False
+            try:
+                request = json.loads(self.rfile.read(length))
+                command = request.get("cmd", "")
+                if command == "exit":
+                    result = {"success": True}
+                    stop = True
+                else:
+                    with self.server.lock:
+                        result = {"success": True, **dispatch(
+                            self.server.ctrl,
+                            command,
+                            [str(a) for a in request.get("args", [])]
+                        )}
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
+            
+            payload = dump_json(result)
+            self.wfile.write(FRAME_HEADER.pack(len(payload)) + payload)
+            
+            if stop:
+                # shutdown() waits for serve_forever(), so call it off this thread
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+class _DaemonServer(socketserver.ThreadingUnixStreamServer):
+    """Unix socket server with one thread per client connection."""
+    daemon_threads = True
+
+
+def default_socket_path() -> str:
+    """Socket path for ``serve``: the pkexec caller's runtime dir, if known."""
+    owner = os.environ.get("PKEXEC_UID")
+    if owner is not None:
+        return f"/run/user/{owner}/nvoc.sock"
+    return SOCKET_PATH
+
+
+def _check_socket_dir(socket_path: str, owner: Optional[str]) -> None:
+    """
+    Refuse socket paths outside /run and the pkexec caller's runtime dir.
+    
+    Raises:
+        UsageError: If the socket's parent directory is not allowed
+    """
+    allowed = {"/run"}
+    if owner is not None:
+        allowed.add(f"/run/user/{owner}")
+    parent = os.path.dirname(os.path.normpath(os.path.abspath(socket_path)))
+    if parent not in allowed:
+        raise UsageError(f"Refusing socket path outside {', '.join(sorted(allowed))}: {socket_path}")
+
+
+def cmd_serve(socket_path: str = SOCKET_PATH) -> None:
+    """
+    Run as a long-lived daemon, serving commands over a Unix socket.
+    
+    One NVML session is held open for the lifetime of the daemon, and
+    requests from all connections are serialized on it. Only root and
+    the user who started the daemon via pkexec (PKEXEC_UID) may connect;
+    this is enforced by socket permissions and checked with SO_PEERCRED.
+    An ``exit`` request stops the daemon.
+    
+    The socket is bound under a temporary name, handed to the owner
+    without following symlinks, and renamed into place, so it only
+    appears at socket_path once the owner can connect.
+    
+    Raises:
+        UsageError: If socket_path is outside the allowed directories
+    """
+    owner = os.environ.get("PKEXEC_UID")
+    _check_socket_dir(socket_path, owner)
+    allowed_uids = {0}
+    if owner is not None:
+        allowed_uids.add(int(owner))
+    
+    tmp_path = os.path.join(os.path.dirname(socket_path), f".nvoc.sock.{os.getpid()}")
+    try:
+        os.unlink(tmp_path)  # Never follows symlinks
+    except FileNotFoundError:
+        pass
+    
+    with NVMLController() as ctrl:
+        # Create the socket without any window where others could connect
+        old_umask = os.umask(0o177)
+        try:
+            server = _DaemonServer(tmp_path, _RequestHandler)
+        finally:
+            os.umask(old_umask)
+        server.ctrl = ctrl
+        server.lock = threading.Lock()
+        server.allowed_uids = allowed_uids
+        try:
+            if owner is not None:
+                os.chown(tmp_path, int(owner), -1, follow_symlinks=False)
+            # Atomically replaces any stale socket (or symlink) at socket_path
+            os.rename(tmp_path, socket_path)
+            
+            # Exit through the finally block on SIGTERM so the socket is removed
+            signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+            
+            logger.info(f"Serving on {socket_path}")
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            for path in (tmp_path, socket_path):
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
 
 
 def main() -> int:
@@ -205,52 +404,20 @@ def main() -> int:
     command = sys.argv[1]
     
     try:
-        if command == "status":
-            cmd_status()
-        
-        elif command == "set-power-limit":
-            if len(sys.argv) < 3:
-                output_error("Usage: set-power-limit <watts>")
-                return 1
-            watts = float(sys.argv[2])
-            cmd_set_power_limit(watts)
-        
-        elif command == "set-clock-offsets":
-            if len(sys.argv) < 4:
-                output_error("Usage: set-clock-offsets <core_mhz> <mem_mhz>")
-                return 1
-            core = int(sys.argv[2])
-            mem = int(sys.argv[3])
-            cmd_set_clock_offsets(core, mem)
-            
-        elif command == "set-locked-clocks":
-            if len(sys.argv) < 4:
-                output_error("Usage: set-locked-clocks <min_mhz> <max_mhz>")
-                return 1
-            min_mhz = int(sys.argv[2])
-            max_mhz = int(sys.argv[3])
-            cmd_set_locked_clocks(min_mhz, max_mhz)
-        
-        elif command == "reset-clocks":
-            cmd_reset_clocks()
-        
-        elif command == "set-fan-speed":
-            if len(sys.argv) < 3:
-                output_error("Usage: set-fan-speed <percent> [fan_idx]")
+        if command in GPU_COMMANDS:
+            try:
+                with NVMLController() as ctrl:
+                    output_success(dispatch(ctrl, command, sys.argv[2:]))
+            except UsageError as e:
+                output_error(str(e))
                 return 1
-            percent = int(sys.argv[2])
-            fan_idx = int(sys.argv[3]) if len(sys.argv) > 3 else 0
-            cmd_set_fan_speed(percent, fan_idx)
-        
-        elif command == "set-fan-auto":
-            fan_idx = int(sys.argv[2]) if len(sys.argv) > 2 else 0
-            cmd_set_fan_auto(fan_idx)
         
-        elif command == "apply-profile":
-            if len(sys.argv) < 3:
-                output_error("Usage: apply-profile <json>")
+        elif command == "serve":
+            try:
+                cmd_serve(sys.argv[2] if len(sys.argv) > 2 else default_socket_path())
+            except UsageError as e:
+                output_error(str(e))
                 return 1
-            cmd_apply_profile(sys.argv[2])
         
         elif command == "apply-boot-profile":
             # Apply boot profile from config (for systemd service)
@@ -270,9 +437,10 @@ def main() -> int:
             # Set crash-safe flag
             set_applying_flag()
             try:
+                # One small JSON read resolves the profile. This runs as root, so
+                # don't trust a binary (pickle) cache from a user-writable directory.
                 profile_manager = ProfileManager()
-                profiles = profile_manager.list_profiles()
-                profile = next((p for p in profiles if p.name == config.boot_profile_name), None)
+                profile = profile_manager.get_profile_by_name(config.boot_profile_name)
                 
                 if profile is None:
                     clear_applying_flag()
@@ -283,7 +451,7 @@ def main() -> int:
                 with NVMLController() as controller:
                     if profile.power_limit_watts:
                         controller.set_power_limit(profile.power_limit_watts)
-                    controller.set_clock_offsets(profile.core_offset_mhz, profile.memory_offset_mhz)
+                    controller.set_clock_offsets(profile.core_clock_offset_mhz, profile.memory_clock_offset_mhz)
                     if profile.max_clock_mhz:
                         controller.set_gpu_locked_clocks(0, profile.max_clock_mhz)
                 
@@ -303,19 +471,11 @@ def main() -> int:
         
         elif command == "list-gpus":
             # List all GPUs in system (Phase 18 multi-GPU)
-            import pynvml
             try:
-                pynvml.nvmlInit()
-                count = pynvml.nvmlDeviceGetCount()
-                gpus = []
-                for i in range(count):
-                    handle = pynvml.nvmlDeviceGetHandleByIndex(i)
-                    name = pynvml.nvmlDeviceGetName(handle)
-                    gpus.append({"index": i, "name": name})
-                pynvml.nvmlShutdown()
-                output_success({"gpu_count": count, "gpus": gpus})
-            except Exception as e:
-                output_error(f"Failed to enumerate GPUs: {e}")
+                gpus = NVMLController.list_devices()
+                output_success({"gpu_count": len(gpus), "gpus": gpus})
+            except (NVMLError, ImportError) as e:
+                output_error(str(e))
                 return 1
         
         elif command == "help":
@@ -325,13 +485,16 @@ def main() -> int:
   list-gpus                   - List all GPUs
   list-profiles               - List saved profiles
   set-power-limit <watts>     - Set power limit
-  set-clock-offsets <core> <mem> - Set clock offsets
+  set-clock-offsets <core> <mem> - Set clock offsets ("null" = unchanged)
   set-locked-clocks <min> <max>  - Set frequency lock
   reset-clocks                - Reset clocks to default
   set-fan-speed <pct> [idx]   - Set fan speed
   set-fan-auto [idx]          - Set fan to auto
+  set-all-fans-speed <pct>    - Set every fan's speed
+  set-all-fans-auto           - Set every fan to auto
   apply-profile <json>        - Apply profile JSON
   apply-boot-profile          - Apply boot profile
+  serve [socket_path]         - Serve commands on a Unix socket
   help                        - Show this help"""
             print(help_text)
             output_success({"action": "help"})
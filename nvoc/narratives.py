@@ -6,7 +6,10 @@ Messages rotate and avoid repetition.
 """
 
 import random
-from typing import List, Optional
+import threading
+from collections import deque
+from functools import partial
+from typing import Callable, Deque, Dict, FrozenSet, List, Optional, Set, Tuple
 
 # Message pools for different operation types
 NARRATIVES = {
@@ -62,9 +65,100 @@ NARRATIVES = {
     ],
 }
 
-# Track recently used messages to avoid repetition
-_recent_messages: List[str] = []
+# Freeze the pools, and keep a set per category for cheap overlap checks
+NARRATIVES: Dict[str, Tuple[str, ...]] = {k: tuple(v) for k, v in NARRATIVES.items()}
+_POOL_SETS: Dict[str, FrozenSet[str]] = {k: frozenset(v) for k, v in NARRATIVES.items()}
+
+
+def _build_positions() -> Dict[str, List[Tuple[str, int]]]:
+    """Map each message to its (category, index) slots in the pools."""
+    positions: Dict[str, List[Tuple[str, int]]] = {}
+    for category, pool in NARRATIVES.items():
+        for index, message in enumerate(pool):
+            positions.setdefault(message, []).append((category, index))
+    return positions
+
+
+# Where each message sits in the pools, to zero/restore its selection weight
+_POSITIONS: Dict[str, List[Tuple[str, int]]] = _build_positions()
+
+# Track recently used messages to avoid repetition. Each thread keeps its
+# own history and RNG, so concurrent callers never share mutable state.
+# The history is a FIFO of the last _max_recent picks, mirrored in a set
+# for lookups; recent messages carry a selection weight of 0.0 in the
+# weight lists.
 _max_recent = 5
+_tls = threading.local()
+
+
+class _State:
+    """One thread's narrative history, RNG and per-category weights."""
+    __slots__ = ("recent_set", "recent_queue", "rng", "weights")
+    
+    def __init__(self):
+        self.recent_set: Set[str] = set()
+        self.recent_queue: Deque[str] = deque(maxlen=_max_recent)
+        self.rng = random.Random()
+        self.weights: Dict[str, List[float]] = {
+            k: [1.0] * len(v) for k, v in NARRATIVES.items()
+        }
+
+
+def _get_state() -> _State:
+    """Get this thread's state, creating it on first use."""
+    state = getattr(_tls, "state", None)
+    if state is None:
+        state = _tls.state = _State()
+    return state
+
+
+def _set_weight(weights: Dict[str, List[float]], message: str, value: float) -> None:
+    """Set a message's selection weight in every pool that contains it."""
+    for category, index in _POSITIONS[message]:
+        weights[category][index] = value
+
+
+def _pick(category: str, pool: Tuple[str, ...], pool_set: FrozenSet[str]) -> str:
+    """Pick a message from one category's pool, avoiding recent ones."""
+    st = _get_state()
+    recent_set = st.recent_set
+    recent_queue = st.recent_queue
+    weights = st.weights
+    choice = st.rng.choice
+    
+    if not recent_set or recent_set.isdisjoint(pool_set):
+        # Nothing (from this pool) was used recently, e.g. on first use
+        message = choice(pool)
+    elif recent_set.issuperset(pool_set):
+        # All messages were recent, reset tracking
+        for msg in recent_set:
+            _set_weight(weights, msg, 1.0)
+        recent_set.clear()
+        recent_queue.clear()
+        message = choice(pool)
+    else:
+        # Recent messages have weight 0, so a single draw skips them. (No
+        # cache of "available" tuples keyed on the recent set: building
+        # that key per call costs as much as the filtering it would save.)
+        message = st.rng.choices(pool, weights=weights[category])[0]
+    
+    # Track as recently used, evicting the oldest once full
+    if len(recent_queue) == _max_recent:
+        forgotten = recent_queue[0]  # Dropped by the append below
+        recent_set.discard(forgotten)
+        _set_weight(weights, forgotten, 1.0)
+    recent_queue.append(message)
+    recent_set.add(message)
+    _set_weight(weights, message, 0.0)
+    
+    return message
+
+
+# One pre-bound picker per category, so lookups and validation are a single dict get
+_PICKERS: Dict[str, Callable[[], str]] = {
+    category: partial(_pick, category, pool, _POOL_SETS[category])
+    for category, pool in NARRATIVES.items()
+}
 
 
 def get_narrative(category: str) -> Optional[str]:
@@ -73,26 +167,5 @@ def get_narrative(category: str) -> Optional[str]:
     Avoids repeating recently used messages.
     Returns None if category not found.
     """
-    global _recent_messages
-    
-    pool = NARRATIVES.get(category)
-    if not pool:
-        return None
-    
-    # Filter out recently used messages
-    available = [msg for msg in pool if msg not in _recent_messages]
-    
-    # If all messages were recent, reset tracking
-    if not available:
-        _recent_messages = []
-        available = pool.copy()
-    
-    # Pick random message
-    message = random.choice(available)
-    
-    # Track as recently used
-    _recent_messages.append(message)
-    if len(_recent_messages) > _max_recent:
-        _recent_messages.pop(0)
-    
-    return message
+    pick = _PICKERS.get(category)
+    return pick() if pick is not None else None
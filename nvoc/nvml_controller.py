@@ -15,25 +15,50 @@ API Reference: https://docs.nvidia.com/deploy/nvml-api/
 """
 
 import logging
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional, Tuple, Dict, Any, List
-from enum import Enum
-
-# Import nvidia-ml-py (the official NVIDIA Python bindings)
-try:
-    import pynvml
-except ImportError:
-    raise ImportError(
-        "nvidia-ml-py is required. Install with: pip install nvidia-ml-py"
-    )
+from functools import lru_cache, wraps
+from typing import Optional, Tuple, Dict, Any, List, Callable, Final, Iterator
 
 logger = logging.getLogger(__name__)
 
+# nvidia-ml-py (the official NVIDIA Python bindings), imported on first use
+# so that importing nvoc stays cheap for paths that never touch the GPU
+pynvml = None
+
+
+def _ensure_pynvml():
+    """Import pynvml on first use and return the module."""
+    global pynvml
+    if pynvml is None:
+        try:
+            import pynvml as _pynvml
+        except ImportError:
+            raise ImportError(
+                "nvidia-ml-py is required. Install with: pip install nvidia-ml-py"
+            )
+        pynvml = _pynvml
+    return pynvml
+
+
+def _decode_utf8(value: bytes) -> str:
+    """Decode a bytes string returned by older pynvml versions."""
+    return value.decode('utf-8')
+
+
+@lru_cache(maxsize=16)
+def _get_handle(index: int):
+    """Get the NVML device handle for a GPU index (cached until nvmlShutdown)."""
+    return pynvml.nvmlDeviceGetHandleByIndex(index)
+
 
 # =============================================================================
 # SAFETY LIMITS - DO NOT MODIFY WITHOUT CAREFUL CONSIDERATION
 # =============================================================================
 
+@dataclass(frozen=True, slots=True)
 class SafetyLimits:
     """
     Hard safety limits for overclocking operations.
@@ -42,6 +67,8 @@ class SafetyLimits:
     The actual GPU may support higher values, but we cap them here
     as a safety measure. Users who want to push beyond these limits
     should use nvidia-smi directly (at their own risk).
+    
+    Use the shared immutable LIMITS instance below.
     """
     # Maximum core clock offset in MHz (positive or negative)
     MAX_CORE_CLOCK_OFFSET_MHZ: int = 1500  # "Sky's the limit"
@@ -59,6 +86,14 @@ class SafetyLimits:
     WARNING_TEMP_CELSIUS: int = 80
 
 
+LIMITS = SafetyLimits()
+
+
+def clamp(value, lo, hi):
+    """Clamp value into [lo, hi]; callers compare the result to detect clamping."""
+    return lo if value < lo else hi if value > hi else value
+
+
 class NVMLError(Exception):
     """Base exception for NVML-related errors."""
     pass
@@ -79,7 +114,7 @@ class SafetyLimitExceeded(NVMLError):
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GPUInfo:
     """Information about the GPU."""
     index: int
@@ -92,9 +127,14 @@ class GPUInfo:
     memory_total_mb: int
     
     
-@dataclass
+@dataclass(slots=True)
 class GPUStats:
-    """Real-time GPU statistics."""
+    """
+    Real-time GPU statistics.
+    
+    Built positionally in NVMLController._read_gpu_stats(), so keep the
+    field order in sync with that call.
+    """
     temperature_celsius: int
     fan_speed_percent: int
     power_draw_watts: float
@@ -122,9 +162,20 @@ class GPUStats:
     power_limit_active: bool  # True if power limit is actively constraining boost
     avg_core_clock_mhz: int  # Rolling average clock (30s window)
     memory_errors: int  # ECC/memory error count (0 if not supported)
+
+
+@dataclass(frozen=True, slots=True)
+class GPUStatus:
+    """Core live readings, for pollers that don't need the full GPUStats."""
+    temperature_celsius: int
+    power_draw_watts: float
+    fan_speed_percent: int
+    core_clock_mhz: int
+    memory_clock_mhz: int
+    gpu_utilization_percent: int
     
     
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PowerLimits:
     """Power limit constraints from the GPU."""
     current_watts: float
@@ -133,16 +184,96 @@ class PowerLimits:
     max_watts: float
 
 
-@dataclass 
+@dataclass(frozen=True, slots=True)
 class ClockOffsets:
     """Current clock offset values."""
     core_offset_mhz: int
     memory_offset_mhz: int
 
 
-class FanControlMode(Enum):
-    AUTO = "auto"
-    MANUAL = "manual"
+# Fan control policies (the NVML_FAN_POLICY_* values)
+FAN_POLICY_AUTO: Final = 0    # NVML_FAN_POLICY_TEMPERATURE_CONTINOUS_SW
+FAN_POLICY_MANUAL: Final = 1  # NVML_FAN_POLICY_MANUAL
+
+
+# Stats read together in one nvmlDeviceGetFieldValues() round-trip, keyed
+# by the name get_gpu_stats() uses. NVML has no field IDs for temperature,
+# clocks or utilization, so those remain individual queries.
+_STATS_FIELDS = {
+    "power_mw": "NVML_FI_DEV_POWER_AVERAGE",
+    "memory_errors": "NVML_FI_DEV_ECC_DBE_VOL_TOTAL",
+}
+
+# c_nvmlFieldValue_t.value union member for each NVML_VALUE_TYPE_* code
+_FIELD_VALUE_MEMBERS = ("dVal", "uiVal", "ulVal", "ullVal", "sllVal", "siVal")
+
+# Throttle reason bits and their display labels, in display order
+_THROTTLE_TABLE = (
+    ("nvmlClocksThrottleReasonGpuIdle", "IDLE"),
+    # Power Limits (separate SW and HW)
+    ("nvmlClocksThrottleReasonSwPowerCap", "Power (SW)"),
+    ("nvmlClocksThrottleReasonHwPowerBrakeSlowdown", "Power (HW)"),
+    # Thermal Limits (separate types)
+    ("nvmlClocksThrottleReasonSwThermalSlowdown", "Thermal (SW)"),
+    ("nvmlClocksThrottleReasonHwThermalSlowdown", "Thermal (HW)"),
+    ("nvmlClocksThrottleReasonHwSlowdown", "HW Slowdown"),
+    ("nvmlClocksThrottleReasonSyncBoost", "Sync Boost"),
+    ("nvmlClocksThrottleReasonDisplayClockSetting", "Display"),
+    ("nvmlClocksThrottleReasonApplicationsClocksSetting", "App Clocks"),
+)
+
+# Device events subscribe_events() watches, where the GPU supports them
+_EVENT_TYPES = (
+    "nvmlEventTypeClock",
+    "nvmlEventTypePState",
+    "nvmlEventTypeXidCriticalError",
+)
+
+# stats_stream() never samples more often than this, however many events
+# arrive (boost clocks under load fire them in bursts)
+_STREAM_MIN_INTERVAL_S = 0.25
+
+# The rolling average takes at most one clock sample per period, so its
+# 30 samples span ~30 s whether they come from polls or events
+_CLOCK_SAMPLE_PERIOD_S = 1.0
+
+
+@lru_cache(maxsize=1)
+def _get_throttle_masks() -> Tuple[Tuple[int, str], ...]:
+    """Resolve _THROTTLE_TABLE to (bitmask, label) pairs once pynvml is loaded."""
+    return tuple((getattr(pynvml, name), label) for name, label in _THROTTLE_TABLE)
+
+
+@lru_cache(maxsize=1)
+def _get_power_mask() -> int:
+    """Combined bitmask of the throttle reasons that mean "power limited"."""
+    return (pynvml.nvmlClocksThrottleReasonSwPowerCap
+            | pynvml.nvmlClocksThrottleReasonHwPowerBrakeSlowdown)
+
+
+def _cached(ttl: Optional[float] = None):
+    """
+    Memoize an NVMLController method per instance and arguments.
+    
+    With ttl=None the value is kept until shutdown (for properties that
+    cannot change while the driver is loaded); otherwise it is reused for
+    ttl seconds, which collapses back-to-back polls from several pages.
+    """
+    def decorator(func):
+        name = func.__name__
+        
+        @wraps(func)
+        def wrapper(self, *args):
+            key = (name, *args)
+            now = time.monotonic() if ttl is not None else 0.0
+            hit = self._cache.get(key)
+            if hit is not None and (ttl is None or now - hit[0] < ttl):
+                return hit[1]
+            value = func(self, *args)
+            self._cache[key] = (now, value)
+            return value
+        return wrapper
+    return decorator
 
 
 class NVMLController:
@@ -177,7 +308,22 @@ class NVMLController:
         self._handle = None
         self._initialized = False
         self._peak_core_clock = 0  # Track peak clock for load monitoring
-        self._clock_samples: list[int] = []  # Rolling buffer for avg clock (max 30 samples)
+        self._clock_samples: deque[int] = deque(maxlen=30)  # Rolling buffer for avg clock
+        self._clock_sum = 0  # Running sum of _clock_samples
+        self._clock_sampled_at = 0.0  # monotonic() of the last rolling-average sample
+        # Peak/average are read-modify-write; an old sampler may still be reading
+        self._clock_lock = threading.Lock()
+        self._static_status: Optional[Dict[str, Any]] = None  # Invariant part of get_status_bundle()
+        self._cache: Dict[tuple, Tuple[float, Any]] = {}  # Backing store for @_cached methods
+        self._decode: Callable[[Any], str] = str  # bytes/str normalizer, chosen in initialize()
+        self._memory_total_mb = 0  # Read once in initialize()
+        self._latest_stats: Optional[GPUStats] = None  # Published by the background sampler
+        self._sampler: Optional[threading.Thread] = None
+        self._sampler_stop = threading.Event()
+        # Stopped without waiting; joined before NVML shuts down
+        self._stopped_samplers: List[threading.Thread] = []
+        self._event_thread: Optional[threading.Thread] = None
+        self._event_stop = threading.Event()
         
     def __enter__(self):
         self.initialize()
@@ -195,6 +341,7 @@ class NVMLController:
             GPUNotFoundError: If no compatible GPU is found
             NVMLError: If initialization fails
         """
+        _ensure_pynvml()
         try:
             pynvml.nvmlInit()
             self._initialized = True
@@ -211,7 +358,17 @@ class NVMLController:
                 )
             
             # Get device handle
-            self._handle = pynvml.nvmlDeviceGetHandleByIndex(self._gpu_index)
+            self._handle = _get_handle(self._gpu_index)
+            
+            # Total VRAM is fixed; usage is read per poll
+            self._memory_total_mb = pynvml.nvmlDeviceGetMemoryInfo(self._handle).total >> 20
+            
+            # Strings come back as bytes or str depending on the pynvml
+            # version; pick the conversion once instead of on every read
+            if isinstance(pynvml.nvmlDeviceGetName(self._handle), bytes):
+                self._decode = _decode_utf8
+            else:
+                self._decode = str
             
             logger.info(f"NVML initialized successfully for GPU {self._gpu_index}")
             
@@ -220,11 +377,16 @@ class NVMLController:
     
     def shutdown(self) -> None:
         """Shutdown NVML and release resources."""
+        self.stop_background_sampler()
+        self.unsubscribe_events()
         if self._initialized:
             try:
                 pynvml.nvmlShutdown()
+                _get_handle.cache_clear()  # Handles are invalid after shutdown
                 self._initialized = False
                 self._handle = None
+                self._static_status = None
+                self._cache.clear()
                 logger.info("NVML shutdown complete")
             except pynvml.NVMLError as e:
                 logger.warning(f"Error during NVML shutdown: {e}")
@@ -234,38 +396,263 @@ class NVMLController:
         if not self._initialized or self._handle is None:
             raise NVMLError("NVML not initialized. Call initialize() first.")
     
+    # =========================================================================
+    # Background Sampling and Events
+    # =========================================================================
+    
+    def start_background_sampler(
+        self,
+        interval_s: float = 1.0,
+        on_sample: Optional[Callable[[GPUStats], None]] = None,
+    ) -> None:
+        """
+        Sample GPU stats on a background thread.
+        
+        While running, get_gpu_stats() and get_status() return the latest
+        snapshot instead of blocking the caller on NVML. Samples come from
+        stats_stream(), so a clock or P-state change is picked up straight
+        away rather than at the next tick. Calling this again restarts the
+        sampler with the new interval.
+        
+        Args:
+            interval_s: Longest time between samples
+            on_sample: Called on the sampler thread with every new sample;
+                GTK callers should hop back with GLib.idle_add()
+        """
+        self._ensure_initialized()
+        # Don't block the caller on the old thread's event wait; it checks
+        # its stop flag before publishing anything else
+        self.stop_background_sampler(wait=False)
+        
+        # Take the first sample here so readers never see a gap
+        self._latest_stats = self._read_gpu_stats()
+        
+        stop = self._sampler_stop = threading.Event()
+        self._sampler = threading.Thread(
+            target=self._sampler_loop,
+            args=(interval_s, stop, on_sample),
+            name="nvoc-sampler",
+            daemon=True,
+        )
+        self._sampler.start()
+        logger.info(f"Background sampler started ({interval_s:.2f}s interval)")
+    
+    def stop_background_sampler(self, wait: bool = True) -> None:
+        """
+        Stop the background sampler, if running.
+        
+        Args:
+            wait: Join the sampler thread, and any earlier ones stopped
+                without waiting (needed before NVML shutdown)
+        """
+        if self._sampler is not None:
+            self._sampler_stop.set()
+            self._stopped_samplers.append(self._sampler)
+            self._sampler = None
+            self._latest_stats = None
+        if wait:
+            while self._stopped_samplers:
+                self._stopped_samplers.pop().join()
+        else:
+            # Forget threads that have already finished
+            self._stopped_samplers = [t for t in self._stopped_samplers if t.is_alive()]
+    
+    def _sampler_loop(self, interval_s: float, stop: threading.Event,
+                      on_sample: Optional[Callable[[GPUStats], None]]) -> None:
+        """Sampler thread body: publish every GPUStats from stats_stream()."""
+        stream = self.stats_stream(int(interval_s * 1000), stop)
+        try:
+            for stats in stream:
+                if stop.is_set():
+                    break
+                # Publishing is a single reference swap, so readers need no lock
+                self._latest_stats = stats
+                if on_sample is not None:
+                    try:
+                        on_sample(stats)
+                    except Exception as e:
+                        logger.error(f"Stats sample callback failed: {e}")
+        finally:
+            stream.close()
+    
+    def stats_stream(self, interval_ms: int = 1000,
+                     stop: Optional[threading.Event] = None) -> Iterator[GPUStats]:
+        """
+        Yield GPU stats whenever they are likely to have changed.
+        
+        Blocks in nvmlEventSetWait() between samples, so a clock or P-state
+        event produces a sample immediately, though never sooner than
+        _STREAM_MIN_INTERVAL_S after the previous one. Utilization and
+        temperature raise no events, so a sample is also taken after
+        interval_ms without one. GPUs without event support are simply
+        polled. Transient read failures are logged and skipped.
+        
+        Args:
+            interval_ms: Longest time between samples
+            stop: Ends the stream once set (checked between samples)
+            
+        Yields:
+            GPUStats snapshots
+        """
+        self._ensure_initialized()
+        try:
+            event_set = self._create_event_set()
+        except NVMLError as e:
+            logger.info(f"GPU events unavailable, polling stats: {e}")
+            event_set = None
+        
+        last_sample = None
+        try:
+            while stop is None or not stop.is_set():
+                if last_sample is not None:
+                    delay = last_sample + _STREAM_MIN_INTERVAL_S - time.monotonic()
+                    if delay > 0:
+                        if stop is not None:
+                            if stop.wait(delay):
+                                break
+                        else:
+                            time.sleep(delay)
+                last_sample = time.monotonic()
+                try:
+                    yield self._read_gpu_stats()
+                except NVMLError as e:
+                    logger.warning(f"Stats sample failed: {e}")
+                
+                if event_set is None:
+                    if stop is not None:
+                        stop.wait(interval_ms / 1000.0)
+                    else:
+                        time.sleep(interval_ms / 1000.0)
+                    continue
+                try:
+                    pynvml.nvmlEventSetWait(event_set, interval_ms)
+                except pynvml.NVMLError_Timeout:
+                    pass
+                except pynvml.NVMLError as e:
+                    logger.warning(f"GPU event wait failed, polling stats: {e}")
+                    try:
+                        pynvml.nvmlEventSetFree(event_set)
+                    except pynvml.NVMLError:
+                        pass
+                    event_set = None
+        finally:
+            if event_set is not None:
+                try:
+                    pynvml.nvmlEventSetFree(event_set)
+                except pynvml.NVMLError:
+                    pass
+    
+    def _create_event_set(self):
+        """
+        Create an NVML event set registered for _EVENT_TYPES on this GPU.
+        
+        Raises:
+            NVMLError: If the GPU supports none of the events or NVML fails
+        """
+        try:
+            supported = pynvml.nvmlDeviceGetSupportedEventTypes(self._handle)
+            event_types = 0
+            for name in _EVENT_TYPES:
+                event_types |= getattr(pynvml, name, 0)
+            event_types &= supported
+            if not event_types:
+                raise NVMLError("GPU does not support clock/P-state/XID events")
+            
+            event_set = pynvml.nvmlEventSetCreate()
+            try:
+                pynvml.nvmlDeviceRegisterEvents(self._handle, event_types, event_set)
+            except pynvml.NVMLError:
+                pynvml.nvmlEventSetFree(event_set)
+                raise
+        except pynvml.NVMLError as e:
+            raise NVMLError(f"Failed to subscribe to GPU events: {e}")
+        return event_set
+    
+    def subscribe_events(self, callback: Callable[[int, int], None]) -> None:
+        """
+        Watch for clock, P-state and XID events on a background thread.
+        
+        The thread blocks in nvmlEventSetWait(), so nothing is queried
+        while the GPU is in a steady state. callback(event_type,
+        event_data) is called on that thread for every event; GTK
+        callers should hop back with GLib.idle_add().
+        
+        Args:
+            callback: Called with the NVML event type bit and its data
+            
+        Raises:
+            NVMLError: If the GPU supports none of the watched events
+        """
+        self._ensure_initialized()
+        self.unsubscribe_events()
+        event_set = self._create_event_set()
+        
+        stop = self._event_stop = threading.Event()
+        self._event_thread = threading.Thread(
+            target=self._event_loop,
+            args=(event_set, callback, stop),
+            name="nvoc-events",
+            daemon=True,
+        )
+        self._event_thread.start()
+    
+    def unsubscribe_events(self) -> None:
+        """Stop the event watcher, if running."""
+        if self._event_thread is None:
+            return
+        self._event_stop.set()
+        self._event_thread.join()
+        self._event_thread = None
+    
+    def _event_loop(self, event_set, callback: Callable[[int, int], None],
+                    stop: threading.Event) -> None:
+        """Event thread body: wait on the event set until stopped."""
+        try:
+            while not stop.is_set():
+                try:
+                    # Wake up once a second to notice unsubscribe_events()
+                    data = pynvml.nvmlEventSetWait(event_set, 1000)
+                except pynvml.NVMLError_Timeout:
+                    continue
+                except pynvml.NVMLError as e:
+                    logger.warning(f"GPU event watch stopped: {e}")
+                    break
+                try:
+                    callback(data.eventType, data.eventData)
+                except Exception as e:
+                    logger.error(f"GPU event callback failed: {e}")
+        finally:
+            try:
+                pynvml.nvmlEventSetFree(event_set)
+            except pynvml.NVMLError:
+                pass
+    
     # =========================================================================
     # GPU Information
     # =========================================================================
     
+    @_cached()
     def get_gpu_info(self) -> GPUInfo:
         """
         Get static GPU information.
         
+        Read once per NVML session; the PCIe fields reflect the link at
+        that time (GPUStats carries the live link state).
+        
         Returns:
             GPUInfo object with GPU details
         """
         self._ensure_initialized()
         
         try:
-            name = pynvml.nvmlDeviceGetName(self._handle)
-            # Handle bytes vs string (depends on pynvml version)
-            if isinstance(name, bytes):
-                name = name.decode('utf-8')
-                
-            uuid = pynvml.nvmlDeviceGetUUID(self._handle)
-            if isinstance(uuid, bytes):
-                uuid = uuid.decode('utf-8')
-                
-            driver_version = pynvml.nvmlSystemGetDriverVersion()
-            if isinstance(driver_version, bytes):
-                driver_version = driver_version.decode('utf-8')
+            decode = self._decode
+            name = decode(pynvml.nvmlDeviceGetName(self._handle))
+            uuid = decode(pynvml.nvmlDeviceGetUUID(self._handle))
+            driver_version = decode(pynvml.nvmlSystemGetDriverVersion())
             
             # VBIOS version
             try:
-                vbios = pynvml.nvmlDeviceGetVbiosVersion(self._handle)
-                if isinstance(vbios, bytes):
-                    vbios = vbios.decode('utf-8')
+                vbios = decode(pynvml.nvmlDeviceGetVbiosVersion(self._handle))
             except pynvml.NVMLError:
                 vbios = "Unknown"
             
@@ -277,10 +664,6 @@ class NVMLController:
                 pcie_gen = 0
                 pcie_width = 0
             
-            # Memory info
-            memory_info = pynvml.nvmlDeviceGetMemoryInfo(self._handle)
-            memory_total_mb = memory_info.total // (1024 * 1024)
-            
             return GPUInfo(
                 index=self._gpu_index,
                 name=name,
@@ -289,7 +672,7 @@ class NVMLController:
                 vbios_version=vbios,
                 pcie_gen=pcie_gen,
                 pcie_width=pcie_width,
-                memory_total_mb=memory_total_mb
+                memory_total_mb=self._memory_total_mb
             )
             
         except pynvml.NVMLError as e:
@@ -299,177 +682,379 @@ class NVMLController:
         """
         Get real-time GPU statistics.
         
+        While the background sampler runs this returns its latest
+        snapshot without touching NVML; otherwise the GPU is queried
+        on the calling thread.
+        
         Returns:
             GPUStats object with current values
         """
+        latest = self._latest_stats
+        if latest is not None:
+            return latest
+        return self._read_gpu_stats()
+    
+    @_cached(ttl=0.1)
+    def _read_gpu_stats(self) -> GPUStats:
+        """
+        Query NVML for a fresh GPUStats.
+        
+        Several pages poll on the same tick, so a reading is reused
+        for 100 ms instead of hitting NVML again.
+        """
         self._ensure_initialized()
         
+        # Hot path: keep the module and handle in locals
+        nv = pynvml
+        handle = self._handle
+        
         try:
             # Temperature
-            temp = pynvml.nvmlDeviceGetTemperature(
-                self._handle, 
-                pynvml.NVML_TEMPERATURE_GPU
+            temp = nv.nvmlDeviceGetTemperature(
+                handle, 
+                nv.NVML_TEMPERATURE_GPU
             )
             
             # Fan speed (may not be available on all GPUs)
             try:
-                fan_speed = pynvml.nvmlDeviceGetFanSpeed(self._handle)
-            except pynvml.NVMLError:
+                fan_speed = nv.nvmlDeviceGetFanSpeed(handle)
+            except nv.NVMLError:
                 fan_speed = 0
             
+            # Batched fields (power draw, ECC errors) in one round-trip
+            fields = self._get_stats_fields()
+            
             # Power
-            try:
-                power_draw = pynvml.nvmlDeviceGetPowerUsage(self._handle) / 1000.0
-            except pynvml.NVMLError:
-                power_draw = 0.0
+            power_mw = fields.get("power_mw")
+            if power_mw is not None:
+                power_draw = power_mw / 1000.0
+            else:
+                try:
+                    power_draw = nv.nvmlDeviceGetPowerUsage(handle) / 1000.0
+                except nv.NVMLError:
+                    power_draw = 0.0
                 
             try:
-                power_limit = pynvml.nvmlDeviceGetPowerManagementLimit(self._handle) / 1000.0
-            except pynvml.NVMLError:
+                power_limit = nv.nvmlDeviceGetPowerManagementLimit(handle) / 1000.0
+            except nv.NVMLError:
                 power_limit = 0.0
             
             # Utilization
             try:
-                utilization = pynvml.nvmlDeviceGetUtilizationRates(self._handle)
+                utilization = nv.nvmlDeviceGetUtilizationRates(handle)
                 gpu_util = utilization.gpu
                 mem_util = utilization.memory
-            except pynvml.NVMLError:
+            except nv.NVMLError:
                 gpu_util = 0
                 mem_util = 0
             
-            # Memory
-            memory_info = pynvml.nvmlDeviceGetMemoryInfo(self._handle)
-            memory_used_mb = memory_info.used // (1024 * 1024)
-            memory_total_mb = memory_info.total // (1024 * 1024)
+            # Memory (only usage changes; the total is read at initialize)
+            memory_used_mb = nv.nvmlDeviceGetMemoryInfo(handle).used >> 20
+            memory_total_mb = self._memory_total_mb
             
             # Clock speeds (Effective)
             try:
-                core_clock = pynvml.nvmlDeviceGetClockInfo(
-                    self._handle, 
-                    pynvml.NVML_CLOCK_GRAPHICS
+                core_clock = nv.nvmlDeviceGetClockInfo(
+                    handle, 
+                    nv.NVML_CLOCK_GRAPHICS
                 )
-            except pynvml.NVMLError:
+            except nv.NVMLError:
                 core_clock = 0
                 
             try:
-                memory_clock = pynvml.nvmlDeviceGetClockInfo(
-                    self._handle, 
-                    pynvml.NVML_CLOCK_MEM
+                memory_clock = nv.nvmlDeviceGetClockInfo(
+                    handle, 
+                    nv.NVML_CLOCK_MEM
                 )
-            except pynvml.NVMLError:
+            except nv.NVMLError:
                 memory_clock = 0
             
             # Throttle Reasons (Enhanced Granularity)
-            throttle_reasons = []
             try:
                 # Get bitmask of active throttle reasons
-                reasons_mask = pynvml.nvmlDeviceGetCurrentClocksThrottleReasons(self._handle)
-                
-                if reasons_mask & pynvml.nvmlClocksThrottleReasonGpuIdle:
-                    throttle_reasons.append("IDLE")
-                
-                # Power Limits (separate SW and HW)
-                if reasons_mask & pynvml.nvmlClocksThrottleReasonSwPowerCap:
-                    throttle_reasons.append("Power (SW)")
-                if reasons_mask & pynvml.nvmlClocksThrottleReasonHwPowerBrakeSlowdown:
-                    throttle_reasons.append("Power (HW)")
-                
-                # Thermal Limits (separate types)
-                if reasons_mask & pynvml.nvmlClocksThrottleReasonSwThermalSlowdown:
-                    throttle_reasons.append("Thermal (SW)")
-                if reasons_mask & pynvml.nvmlClocksThrottleReasonHwThermalSlowdown:
-                    throttle_reasons.append("Thermal (HW)")
-                if reasons_mask & pynvml.nvmlClocksThrottleReasonHwSlowdown:
-                    throttle_reasons.append("HW Slowdown")
-                
-                # Sync Boost
-                if reasons_mask & pynvml.nvmlClocksThrottleReasonSyncBoost:
-                    throttle_reasons.append("Sync Boost")
-                
-                # Display Clock Setting
-                if reasons_mask & pynvml.nvmlClocksThrottleReasonDisplayClockSetting:
-                    throttle_reasons.append("Display")
+                reasons_mask = nv.nvmlDeviceGetCurrentClocksThrottleReasons(handle)
+            except nv.NVMLError:
+                reasons_mask = 0  # Ignore if not supported
+            throttle_reasons = [
+                label for mask, label in _get_throttle_masks() if reasons_mask & mask
+            ]
+            power_limit_active = bool(reasons_mask & _get_power_mask())
+            
+            with self._clock_lock:
+                # Track peak clock (for load monitoring)
+                if core_clock > self._peak_core_clock:
+                    self._peak_core_clock = core_clock
                 
-                # Application Clocks Setting
-                if reasons_mask & pynvml.nvmlClocksThrottleReasonApplicationsClocksSetting:
-                    throttle_reasons.append("App Clocks")
-                    
-            except Exception:
-                pass  # Ignore if not supported
-            
-            # Track peak clock (for load monitoring)
-            if core_clock > self._peak_core_clock:
-                self._peak_core_clock = core_clock
-            
-            # Rolling average clock (keep last 30 samples = ~30 seconds at 1/sec)
-            self._clock_samples.append(core_clock)
-            if len(self._clock_samples) > 30:
-                self._clock_samples.pop(0)
-            avg_clock = sum(self._clock_samples) // len(self._clock_samples) if self._clock_samples else 0
-            
-            # PCIe link state
-            try:
-                pcie_gen = pynvml.nvmlDeviceGetCurrPcieLinkGeneration(self._handle)
-                pcie_width = pynvml.nvmlDeviceGetCurrPcieLinkWidth(self._handle)
-                pcie_gen_max = pynvml.nvmlDeviceGetMaxPcieLinkGeneration(self._handle)
-                pcie_width_max = pynvml.nvmlDeviceGetMaxPcieLinkWidth(self._handle)
-            except pynvml.NVMLError:
-                pcie_gen = pcie_width = pcie_gen_max = pcie_width_max = 0
+                # Rolling average clock (keep last 30 samples = ~30 seconds at 1/sec)
+                samples = self._clock_samples
+                now = time.monotonic()
+                if not samples or now - self._clock_sampled_at >= _CLOCK_SAMPLE_PERIOD_S:
+                    self._clock_sampled_at = now
+                    if len(samples) == samples.maxlen:
+                        self._clock_sum -= samples[0]  # Dropped by the append below
+                    samples.append(core_clock)
+                    self._clock_sum += core_clock
+                avg_clock = self._clock_sum // len(samples)
             
-            # Thermal threshold
+            # PCIe link state (the maximums and the threshold are fixed)
+            thermal_threshold, pcie_gen_max, pcie_width_max = self._get_fixed_limits()
             try:
-                thermal_threshold = pynvml.nvmlDeviceGetTemperatureThreshold(
-                    self._handle, pynvml.NVML_TEMPERATURE_THRESHOLD_SLOWDOWN
-                )
-            except pynvml.NVMLError:
-                thermal_threshold = 83  # Default fallback
-            thermal_headroom = thermal_threshold - temp
+                pcie_gen = nv.nvmlDeviceGetCurrPcieLinkGeneration(handle)
+                pcie_width = nv.nvmlDeviceGetCurrPcieLinkWidth(handle)
+            except nv.NVMLError:
+                pcie_gen = pcie_width = 0
             
-            # Power limit active check (from throttle reasons)
-            power_limit_active = any("Power" in r for r in throttle_reasons)
+            # Thermal headroom
+            thermal_headroom = thermal_threshold - temp
             
-            # Memory error count
-            try:
-                memory_errors = pynvml.nvmlDeviceGetTotalEccErrors(
-                    self._handle,
-                    pynvml.NVML_MEMORY_ERROR_TYPE_UNCORRECTED,
-                    pynvml.NVML_VOLATILE_ECC
-                )
-            except pynvml.NVMLError:
-                memory_errors = 0  # Not supported or no ECC
+            # Memory error count (uncorrected, volatile)
+            memory_errors = fields.get("memory_errors")
+            if memory_errors is None:
+                try:
+                    memory_errors = nv.nvmlDeviceGetTotalEccErrors(
+                        handle,
+                        nv.NVML_MEMORY_ERROR_TYPE_UNCORRECTED,
+                        nv.NVML_VOLATILE_ECC
+                    )
+                except nv.NVMLError:
+                    memory_errors = 0  # Not supported or no ECC
             
+            # Positional, in GPUStats field order (skips building a kwargs dict
+            # on every poll); keep in sync with the dataclass
             return GPUStats(
-                temperature_celsius=temp,
-                fan_speed_percent=fan_speed,
-                power_draw_watts=power_draw,
-                power_limit_watts=power_limit,
-                gpu_utilization_percent=gpu_util,
-                memory_utilization_percent=mem_util,
-                memory_used_mb=memory_used_mb,
-                memory_total_mb=memory_total_mb,
-                core_clock_mhz=core_clock,
-                memory_clock_mhz=memory_clock,
-                effective_core_clock_mhz=core_clock,
-                effective_memory_clock_mhz=memory_clock,
-                throttle_reasons=throttle_reasons,
-                peak_core_clock_mhz=self._peak_core_clock,
-                pcie_gen=pcie_gen,
-                pcie_width=pcie_width,
-                pcie_gen_max=pcie_gen_max,
-                pcie_width_max=pcie_width_max,
-                thermal_threshold_celsius=thermal_threshold,
-                thermal_headroom_celsius=thermal_headroom,
-                power_limit_active=power_limit_active,
-                avg_core_clock_mhz=avg_clock,
-                memory_errors=memory_errors
+                temp,                   # temperature_celsius
+                fan_speed,              # fan_speed_percent
+                power_draw,             # power_draw_watts
+                power_limit,            # power_limit_watts
+                gpu_util,               # gpu_utilization_percent
+                mem_util,               # memory_utilization_percent
+                memory_used_mb,         # memory_used_mb
+                core_clock,             # effective_core_clock_mhz
+                memory_clock,           # effective_memory_clock_mhz
+                throttle_reasons,       # throttle_reasons
+                self._peak_core_clock,  # peak_core_clock_mhz
+                memory_total_mb,        # memory_total_mb
+                core_clock,             # core_clock_mhz
+                memory_clock,           # memory_clock_mhz
+                pcie_gen,               # pcie_gen
+                pcie_width,             # pcie_width
+                pcie_gen_max,           # pcie_gen_max
+                pcie_width_max,         # pcie_width_max
+                thermal_threshold,      # thermal_threshold_celsius
+                thermal_headroom,       # thermal_headroom_celsius
+                power_limit_active,     # power_limit_active
+                avg_clock,              # avg_core_clock_mhz
+                memory_errors,          # memory_errors
             )
             
-        except pynvml.NVMLError as e:
+        except nv.NVMLError as e:
             raise NVMLError(f"Failed to get GPU stats: {e}")
     
+    @_cached(ttl=0.1)
+    def get_status(self) -> GPUStatus:
+        """
+        Get the core live readings in one pass.
+        
+        Much cheaper than get_gpu_stats() (six NVML queries instead of
+        around twenty) for callers that only show temperature, power,
+        fan, clocks and load.
+        
+        Returns:
+            GPUStatus snapshot
+        """
+        self._ensure_initialized()
+        
+        latest = self._latest_stats
+        if latest is not None:
+            return GPUStatus(
+                temperature_celsius=latest.temperature_celsius,
+                power_draw_watts=latest.power_draw_watts,
+                fan_speed_percent=latest.fan_speed_percent,
+                core_clock_mhz=latest.core_clock_mhz,
+                memory_clock_mhz=latest.memory_clock_mhz,
+                gpu_utilization_percent=latest.gpu_utilization_percent,
+            )
+        
+        nv = pynvml
+        handle = self._handle
+        
+        try:
+            temp = nv.nvmlDeviceGetTemperature(handle, nv.NVML_TEMPERATURE_GPU)
+        except nv.NVMLError as e:
+            raise NVMLError(f"Failed to get GPU status: {e}")
+        
+        try:
+            power_draw = nv.nvmlDeviceGetPowerUsage(handle) / 1000.0
+        except nv.NVMLError:
+            power_draw = 0.0
+        try:
+            fan_speed = nv.nvmlDeviceGetFanSpeed(handle)
+        except nv.NVMLError:
+            fan_speed = 0
+        try:
+            core_clock = nv.nvmlDeviceGetClockInfo(handle, nv.NVML_CLOCK_GRAPHICS)
+        except nv.NVMLError:
+            core_clock = 0
+        try:
+            memory_clock = nv.nvmlDeviceGetClockInfo(handle, nv.NVML_CLOCK_MEM)
+        except nv.NVMLError:
+            memory_clock = 0
+        try:
+            gpu_util = nv.nvmlDeviceGetUtilizationRates(handle).gpu
+        except nv.NVMLError:
+            gpu_util = 0
+        
+        return GPUStatus(
+            temperature_celsius=temp,
+            power_draw_watts=power_draw,
+            fan_speed_percent=fan_speed,
+            core_clock_mhz=core_clock,
+            memory_clock_mhz=memory_clock,
+            gpu_utilization_percent=gpu_util,
+        )
+    
+    @_cached()
+    def _get_fixed_limits(self) -> Tuple[int, int, int]:
+        """Get (slowdown threshold °C, max PCIe gen, max PCIe width), read once."""
+        try:
+            thermal_threshold = pynvml.nvmlDeviceGetTemperatureThreshold(
+                self._handle, pynvml.NVML_TEMPERATURE_THRESHOLD_SLOWDOWN
+            )
+        except pynvml.NVMLError:
+            thermal_threshold = 83  # Default fallback
+        
+        try:
+            pcie_gen_max = pynvml.nvmlDeviceGetMaxPcieLinkGeneration(self._handle)
+            pcie_width_max = pynvml.nvmlDeviceGetMaxPcieLinkWidth(self._handle)
+        except pynvml.NVMLError:
+            pcie_gen_max = pcie_width_max = 0
+        
+        return thermal_threshold, pcie_gen_max, pcie_width_max
+    
+    @_cached()
+    def _get_stats_field_ids(self) -> Tuple[Tuple[str, int], ...]:
+        """Resolve the batched stats field IDs known to this pynvml version."""
+        if not hasattr(pynvml, "nvmlDeviceGetFieldValues"):
+            return ()
+        return tuple(
+            (key, getattr(pynvml, name))
+            for key, name in _STATS_FIELDS.items()
+            if hasattr(pynvml, name)
+        )
+    
+    def _get_stats_fields(self) -> Dict[str, Any]:
+        """
+        Read the batched stats fields in a single NVML call.
+        
+        Fields the GPU or driver doesn't support are left out, so the
+        caller falls back to the individual query for them.
+        """
+        fields = self._get_stats_field_ids()
+        if not fields:
+            return {}
+        
+        try:
+            values = pynvml.nvmlDeviceGetFieldValues(
+                self._handle, [field_id for _, field_id in fields]
+            )
+        except pynvml.NVMLError:
+            return {}
+        
+        result = {}
+        for (key, _), value in zip(fields, values):
+            if value.nvmlReturn == pynvml.NVML_SUCCESS:
+                result[key] = getattr(value.value, _FIELD_VALUE_MEMBERS[value.valueType])
+        return result
+    
+    def get_status_bundle(self) -> Dict[str, Any]:
+        """
+        Get a complete status snapshot as a JSON-ready dictionary.
+        
+        Fields that never change for the lifetime of the NVML session
+        (name, driver, VBIOS, VRAM size, power constraints) are read once
+        and reused; only the live stats and offsets are re-read per call.
+        
+        Returns:
+            Dictionary with "gpu", "stats", "power_limits", "offsets"
+            and "safety_limits" sections
+        """
+        self._ensure_initialized()
+        
+        if self._static_status is None:
+            info = self.get_gpu_info()
+            power = self.get_power_limits()
+            self._static_status = {
+                "gpu": {
+                    "name": info.name,
+                    "driver": info.driver_version,
+                    "vbios": info.vbios_version,
+                    "vram_total_mb": info.memory_total_mb,
+                },
+                "power_min": power.min_watts,
+                "power_max": power.max_watts,
+                "power_default": power.default_watts,
+            }
+        static = self._static_status
+        
+        stats = self.get_gpu_stats()
+        offsets = self.get_clock_offsets()
+        
+        return {
+            "gpu": static["gpu"],
+            "stats": {
+                "temperature": stats.temperature_celsius,
+                "fan_speed": stats.fan_speed_percent,
+                "power_draw": stats.power_draw_watts,
+                "power_limit": stats.power_limit_watts,
+                "core_clock": stats.core_clock_mhz,
+                "memory_clock": stats.memory_clock_mhz,
+                "gpu_util": stats.gpu_utilization_percent,
+                "mem_util": stats.memory_utilization_percent,
+                "vram_used_mb": stats.memory_used_mb,
+                "effective_core_clock": stats.effective_core_clock_mhz,
+                "effective_memory_clock": stats.effective_memory_clock_mhz,
+                "throttle_reasons": stats.throttle_reasons,
+                "peak_core_clock": stats.peak_core_clock_mhz,
+                "avg_core_clock": stats.avg_core_clock_mhz,
+                "pcie_gen": stats.pcie_gen,
+                "pcie_width": stats.pcie_width,
+                "pcie_gen_max": stats.pcie_gen_max,
+                "pcie_width_max": stats.pcie_width_max,
+                "thermal_threshold": stats.thermal_threshold_celsius,
+                "thermal_headroom": stats.thermal_headroom_celsius,
+                "power_limit_active": stats.power_limit_active,
+                "memory_errors": stats.memory_errors,
+            },
+            "power_limits": {
+                "current": stats.power_limit_watts,
+                "min": static["power_min"],
+                "max": static["power_max"],
+                "default": static["power_default"],
+            },
+            "offsets": {
+                "core": offsets.core_offset_mhz,
+                "memory": offsets.memory_offset_mhz,
+            },
+            "safety_limits": {
+                "max_core_offset": LIMITS.MAX_CORE_CLOCK_OFFSET_MHZ,
+                "max_memory_offset": LIMITS.MAX_MEMORY_CLOCK_OFFSET_MHZ,
+                "min_fan_speed": LIMITS.MIN_FAN_SPEED_PERCENT,
+            },
+        }
+    
+    def _get_temperature(self) -> int:
+        """Read just the GPU temperature, for the setters' safety checks."""
+        try:
+            return pynvml.nvmlDeviceGetTemperature(
+                self._handle, pynvml.NVML_TEMPERATURE_GPU
+            )
+        except pynvml.NVMLError as e:
+            raise NVMLError(f"Failed to read GPU temperature: {e}")
+    
     def reset_peak_clock(self) -> None:
         """Reset the tracked peak core clock to current value."""
-        self._peak_core_clock = 0
+        with self._clock_lock:
+            self._peak_core_clock = 0
         logger.info("Peak clock counter reset")
     
     # =========================================================================
@@ -489,13 +1074,8 @@ class NVMLController:
             # Current power limit (in milliwatts)
             current_mw = pynvml.nvmlDeviceGetPowerManagementLimit(self._handle)
             
-            # Default power limit
-            default_mw = pynvml.nvmlDeviceGetPowerManagementDefaultLimit(self._handle)
-            
-            # Min/max constraints
-            min_mw, max_mw = pynvml.nvmlDeviceGetPowerManagementLimitConstraints(
-                self._handle
-            )
+            # Default and min/max constraints never change at runtime
+            default_mw, min_mw, max_mw = self._get_power_constraints()
             
             return PowerLimits(
                 current_watts=current_mw / 1000.0,
@@ -507,6 +1087,15 @@ class NVMLController:
         except pynvml.NVMLError as e:
             raise NVMLError(f"Failed to get power limits: {e}")
     
+    @_cached()
+    def _get_power_constraints(self) -> Tuple[int, int, int]:
+        """Get (default, min, max) power limits in milliwatts."""
+        default_mw = pynvml.nvmlDeviceGetPowerManagementDefaultLimit(self._handle)
+        min_mw, max_mw = pynvml.nvmlDeviceGetPowerManagementLimitConstraints(
+            self._handle
+        )
+        return default_mw, min_mw, max_mw
+    
     def set_power_limit(self, watts: float) -> None:
         """
         Set GPU power limit.
@@ -527,7 +1116,7 @@ class NVMLController:
             limits = self.get_power_limits()
             
             # Clamp to valid range
-            clamped_watts = max(limits.min_watts, min(watts, limits.max_watts))
+            clamped_watts = clamp(watts, limits.min_watts, limits.max_watts)
             
             if clamped_watts != watts:
                 logger.warning(
@@ -594,7 +1183,7 @@ class NVMLController:
         """
         Set GPU clock offsets for overclocking/underclocking.
         
-        SAFETY: Values are clamped to safe limits defined in SafetyLimits.
+        SAFETY: Values are clamped to safe limits defined in LIMITS.
         
         Args:
             core_offset_mhz: Core clock offset in MHz (can be negative)
@@ -608,55 +1197,57 @@ class NVMLController:
             NVMLError: If operation fails
         """
         self._ensure_initialized()
+        set_core = core_offset_mhz is not None
+        set_mem = memory_offset_mhz is not None
         
         # Get current offsets for any values not specified
-        current = self.get_clock_offsets()
-        
-        if core_offset_mhz is None:
-            core_offset_mhz = current.core_offset_mhz
-        if memory_offset_mhz is None:
-            memory_offset_mhz = current.memory_offset_mhz
+        if not (set_core and set_mem):
+            current = self.get_clock_offsets()
+            if core_offset_mhz is None:
+                core_offset_mhz = current.core_offset_mhz
+            if memory_offset_mhz is None:
+                memory_offset_mhz = current.memory_offset_mhz
         
         # Apply safety limits
-        safe_core = max(
-            -SafetyLimits.MAX_CORE_CLOCK_OFFSET_MHZ,
-            min(core_offset_mhz, SafetyLimits.MAX_CORE_CLOCK_OFFSET_MHZ)
-        )
-        safe_mem = max(
-            -SafetyLimits.MAX_MEMORY_CLOCK_OFFSET_MHZ,
-            min(memory_offset_mhz, SafetyLimits.MAX_MEMORY_CLOCK_OFFSET_MHZ)
-        )
+        max_core = LIMITS.MAX_CORE_CLOCK_OFFSET_MHZ
+        max_mem = LIMITS.MAX_MEMORY_CLOCK_OFFSET_MHZ
+        safe_core = clamp(core_offset_mhz, -max_core, max_core)
+        safe_mem = clamp(memory_offset_mhz, -max_mem, max_mem)
         
         if safe_core != core_offset_mhz:
             logger.warning(
                 f"Core offset {core_offset_mhz}MHz clamped to {safe_core}MHz "
-                f"(safety limit: ±{SafetyLimits.MAX_CORE_CLOCK_OFFSET_MHZ}MHz)"
+                f"(safety limit: ±{LIMITS.MAX_CORE_CLOCK_OFFSET_MHZ}MHz)"
             )
         if safe_mem != memory_offset_mhz:
             logger.warning(
                 f"Memory offset {memory_offset_mhz}MHz clamped to {safe_mem}MHz "
-                f"(safety limit: ±{SafetyLimits.MAX_MEMORY_CLOCK_OFFSET_MHZ}MHz)"
+                f"(safety limit: ±{LIMITS.MAX_MEMORY_CLOCK_OFFSET_MHZ}MHz)"
             )
         
-        # Check temperature before applying
-        stats = self.get_gpu_stats()
-        if stats.temperature_celsius >= SafetyLimits.CRITICAL_TEMP_CELSIUS:
-            raise NVMLError(
-                f"GPU temperature too high ({stats.temperature_celsius}°C). "
-                f"Cannot apply overclock above {SafetyLimits.CRITICAL_TEMP_CELSIUS}°C. "
-                "Cool down the GPU first."
-            )
+        # Check temperature before applying; resets and underclocks can't
+        # add heat, so only positive offsets need the check
+        if safe_core > 0 or safe_mem > 0:
+            temp = self._get_temperature()
+            if temp >= LIMITS.CRITICAL_TEMP_CELSIUS:
+                raise NVMLError(
+                    f"GPU temperature too high ({temp}°C). "
+                    f"Cannot apply overclock above {LIMITS.CRITICAL_TEMP_CELSIUS}°C. "
+                    "Cool down the GPU first."
+                )
         
         try:
-            # Set core clock offset
+            # Set core clock offset (untouched if not specified)
             # nvmlDeviceSetGpcClkVfOffset(handle, offset)
-            pynvml.nvmlDeviceSetGpcClkVfOffset(self._handle, safe_core)
-            logger.info(f"Core clock offset set to {safe_core}MHz")
+            if set_core:
+                pynvml.nvmlDeviceSetGpcClkVfOffset(self._handle, safe_core)
+                logger.info(f"Core clock offset set to {safe_core}MHz")
             
-            # Set memory clock offset
+            # Set memory clock offset (untouched if not specified)
             # nvmlDeviceSetMemClkVfOffset(handle, offset)
-            pynvml.nvmlDeviceSetMemClkVfOffset(self._handle, safe_mem)
-            logger.info(f"Memory clock offset set to {safe_mem}MHz")
+            if set_mem:
+                pynvml.nvmlDeviceSetMemClkVfOffset(self._handle, safe_mem)
+                logger.info(f"Memory clock offset set to {safe_mem}MHz")
             
             return (safe_core, safe_mem)
             
@@ -678,14 +1269,19 @@ class NVMLController:
     # =========================================================================
     
     def get_fan_count(self) -> int:
-        """Get the number of fans on the GPU."""
+        """Get the number of fans on the GPU (0 if NVML can't report it)."""
         self._ensure_initialized()
         
         try:
-            return pynvml.nvmlDeviceGetNumFans(self._handle)
+            return self._get_num_fans()
         except pynvml.NVMLError:
+            # Not cached, so a transient error doesn't stick for the session
             return 0
     
+    @_cached()
+    def _get_num_fans(self) -> int:
+        return pynvml.nvmlDeviceGetNumFans(self._handle)
+    
     def get_fan_speed(self, fan_index: int = 0) -> int:
         """
         Get current fan speed percentage.
@@ -726,39 +1322,55 @@ class NVMLController:
         """
         self._ensure_initialized()
         
+        return self._set_fan_speed_raw(fan_index, self._safe_fan_speed(speed_percent))
+    
+    def _safe_fan_speed(self, speed_percent: int) -> int:
+        """
+        Apply the temperature overrides and safety minimum to a fan speed.
+        
+        Args:
+            speed_percent: Requested fan speed (0-100)
+            
+        Returns:
+            Speed that is safe to apply at the current temperature
+        """
         # Check temperature
-        stats = self.get_gpu_stats()
+        temp = self._get_temperature()
         
         # Force high fan speed if temperature is critical
-        if stats.temperature_celsius >= SafetyLimits.CRITICAL_TEMP_CELSIUS:
+        if temp >= LIMITS.CRITICAL_TEMP_CELSIUS:
             speed_percent = 100
             logger.warning(
-                f"GPU at critical temperature ({stats.temperature_celsius}°C), "
+                f"GPU at critical temperature ({temp}°C), "
                 "forcing fan to 100%"
             )
-        elif stats.temperature_celsius >= SafetyLimits.WARNING_TEMP_CELSIUS:
+        elif temp >= LIMITS.WARNING_TEMP_CELSIUS:
             # Ensure minimum 70% at warning temp
             speed_percent = max(speed_percent, 70)
             logger.warning(
-                f"GPU temperature high ({stats.temperature_celsius}°C), "
+                f"GPU temperature high ({temp}°C), "
                 f"enforcing minimum 70% fan speed"
             )
         
         # Apply safety minimum
-        safe_speed = max(SafetyLimits.MIN_FAN_SPEED_PERCENT, min(100, speed_percent))
+        safe_speed = clamp(speed_percent, LIMITS.MIN_FAN_SPEED_PERCENT, 100)
         
-        if safe_speed != speed_percent and speed_percent < SafetyLimits.MIN_FAN_SPEED_PERCENT:
+        if safe_speed != speed_percent and speed_percent < LIMITS.MIN_FAN_SPEED_PERCENT:
             logger.warning(
                 f"Fan speed {speed_percent}% clamped to {safe_speed}% "
-                f"(safety minimum: {SafetyLimits.MIN_FAN_SPEED_PERCENT}%)"
+                f"(safety minimum: {LIMITS.MIN_FAN_SPEED_PERCENT}%)"
             )
         
+        return safe_speed
+    
+    def _set_fan_speed_raw(self, fan_index: int, safe_speed: int) -> int:
+        """Switch a fan to manual and set an already-validated speed."""
         try:
             # First, set fan control policy to manual
             pynvml.nvmlDeviceSetFanControlPolicy(
                 self._handle, 
                 fan_index, 
-                pynvml.NVML_FAN_POLICY_MANUAL
+                FAN_POLICY_MANUAL
             )
             
             # Set fan speed
@@ -788,7 +1400,7 @@ class NVMLController:
             pynvml.nvmlDeviceSetFanControlPolicy(
                 self._handle, 
                 fan_index, 
-                pynvml.NVML_FAN_POLICY_TEMPERATURE_CONTINOUS_SW
+                FAN_POLICY_AUTO
             )
             logger.info(f"Fan {fan_index} set to automatic control")
             
@@ -800,15 +1412,20 @@ class NVMLController:
         except pynvml.NVMLError as e:
             raise NVMLError(f"Failed to set fan to auto: {e}")
     
-    def set_all_fans_speed(self, speed_percent: int) -> None:
-        """Set all fans to the same speed."""
-        fan_count = self.get_fan_count()
-        for i in range(fan_count):
-            self.set_fan_speed(speed_percent, fan_index=i)
+    def set_all_fans_speed(self, speed_percent: int) -> int:
+        """Set all fans to the same speed; returns the speed actually set."""
+        self._ensure_initialized()
+        
+        # One temperature check and clamp for the whole GPU
+        safe_speed = self._safe_fan_speed(speed_percent)
+        # Many consumer cards report 0 fans (or fail); fan 0 still works there
+        for i in range(max(1, self.get_fan_count())):
+            self._set_fan_speed_raw(i, safe_speed)
+        return safe_speed
     
     def set_all_fans_auto(self) -> None:
         """Set all fans to automatic control."""
-        fan_count = self.get_fan_count()
+        fan_count = max(1, self.get_fan_count())
         for i in range(fan_count):
             self.set_fan_auto(fan_index=i)
 
@@ -860,6 +1477,53 @@ class NVMLController:
             'memory_clock_offset_mhz': clocks.memory_offset_mhz,
         }
     
+    def clamp_settings(self, settings: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Clamp every known field of a settings dictionary in one pass.
+        
+        Uses the same bounds as the individual setters, but reports all
+        adjusted fields in a single warning instead of one per setter.
+        
+        Args:
+            settings: Dictionary with setting values (missing/None skipped)
+            
+        Returns:
+            Copy of settings with out-of-range values clamped
+        """
+        self._ensure_initialized()
+        
+        max_core = LIMITS.MAX_CORE_CLOCK_OFFSET_MHZ
+        max_mem = LIMITS.MAX_MEMORY_CLOCK_OFFSET_MHZ
+        bounds = [
+            ('core_clock_offset_mhz', -max_core, max_core),
+            ('memory_clock_offset_mhz', -max_mem, max_mem),
+            ('fan_speed_percent', LIMITS.MIN_FAN_SPEED_PERCENT, 100),
+        ]
+        
+        # Only query power constraints when there is a power limit to clamp;
+        # GPUs without power management still take clock/fan-only settings
+        if settings.get('power_limit_watts') is not None:
+            try:
+                _, min_mw, max_mw = self._get_power_constraints()
+            except pynvml.NVMLError as e:
+                raise NVMLError(f"Failed to get power limit constraints: {e}")
+            bounds.append(('power_limit_watts', min_mw / 1000.0, max_mw / 1000.0))
+        
+        clamped = dict(settings)
+        changed = []
+        for key, lo, hi in bounds:
+            value = settings.get(key)
+            if value is None:
+                continue
+            safe = clamp(value, lo, hi)
+            if safe != value:
+                clamped[key] = safe
+                changed.append(f"{key} {value} -> {safe}")
+        
+        if changed:
+            logger.warning(f"Clamped to safety limits: {', '.join(changed)}")
+        return clamped
+    
     def apply_settings(self, settings: Dict[str, Any]) -> None:
         """
         Apply a dictionary of settings (useful for profiles).
@@ -867,6 +1531,8 @@ class NVMLController:
         Args:
             settings: Dictionary with setting values
         """
+        settings = self.clamp_settings(settings)
+        
         if 'power_limit_watts' in settings:
             self.set_power_limit(settings['power_limit_watts'])
             
@@ -879,6 +1545,7 @@ class NVMLController:
     @staticmethod
     def get_device_count() -> int:
         """Get the number of NVIDIA GPUs in the system."""
+        _ensure_pynvml()
         try:
             pynvml.nvmlInit()
             count = pynvml.nvmlDeviceGetCount()
@@ -886,6 +1553,33 @@ class NVMLController:
             return count
         except pynvml.NVMLError:
             return 0
+    
+    @staticmethod
+    def list_devices() -> List[Dict[str, Any]]:
+        """
+        List the NVIDIA GPUs in the system.
+        
+        Returns:
+            List of {"index", "name"} dictionaries
+            
+        Raises:
+            NVMLError: If NVML cannot be initialized or queried
+        """
+        _ensure_pynvml()
+        try:
+            pynvml.nvmlInit()
+            try:
+                gpus = []
+                for i in range(pynvml.nvmlDeviceGetCount()):
+                    name = pynvml.nvmlDeviceGetName(pynvml.nvmlDeviceGetHandleByIndex(i))
+                    if isinstance(name, bytes):
+                        name = _decode_utf8(name)
+                    gpus.append({"index": i, "name": name})
+                return gpus
+            finally:
+                pynvml.nvmlShutdown()
+        except pynvml.NVMLError as e:
+            raise NVMLError(f"Failed to enumerate GPUs: {e}")
 
 
 # =============================================================================
@@ -6,22 +6,34 @@ privileged operations via the helper script, allowing the GUI to run
 as a normal user.
 
 Read operations (get_*) are done directly via NVML (no root needed).
-Write operations (set_*) are done via pkexec helper.
+Write operations (set_*) are done via the pkexec helper, which is
+started once as a daemon and then reached over a Unix socket.
 """
 
 import subprocess
 import json
 import logging
+import os
 import shutil
+import socket
+import struct
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, Callable, Iterator, Union
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json is the fallback
+    orjson = None
+
 from .nvml_controller import (
     NVMLController, 
     NVMLError, 
     GPUInfo, 
     GPUStats, 
+    GPUStatus,
     PowerLimits, 
     ClockOffsets,
     SafetyLimits
@@ -29,15 +41,80 @@ from .nvml_controller import (
 
 logger = logging.getLogger(__name__)
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 # Find the helper script location
 HELPER_SCRIPT = Path(__file__).parent / "helper.py"
 
+# Resolved once per process; neither moves while the app is running
+_HELPER_OK = HELPER_SCRIPT.exists()
+_PKEXEC_PATH = shutil.which("pkexec")
+
+# Socket of the helper daemon (``helper.py serve``), started on first write.
+# This is the path the helper allows for the pkexec caller, not
+# $XDG_RUNTIME_DIR, which may point anywhere.
+HELPER_SOCKET = Path(f"/run/user/{os.getuid()}") / "nvoc.sock"
+
+# Daemon frames are a 4-byte big-endian length followed by that much JSON
+_FRAME_HEADER = struct.Struct(">I")
+
+# How long to wait for the daemon socket after pkexec (covers the auth prompt)
+DAEMON_START_TIMEOUT_S = 120
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """Read exactly size bytes from a socket."""
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            raise ConnectionError("Helper daemon closed the connection")
+        buf += chunk
+    return bytes(buf)
+
 
 class PrivilegedControllerError(Exception):
     """Error from privileged operations."""
     pass
 
 
+class _CachedReader:
+    """
+    Proxy around the NVML reader that briefly memoizes read results.
+    
+    Several pages ask for the same offsets and limits on one refresh
+    tick; results are reused for ttl_s seconds. Writes go through the
+    helper, so PrivilegedController invalidates the cache on each one.
+    """
+    
+    _CACHED_METHODS = frozenset({"get_gpu_stats", "get_power_limits", "get_clock_offsets"})
+    
+    def __init__(self, reader: NVMLController, ttl_s: float = 0.2):
+        self._reader = reader
+        self._ttl_s = ttl_s
+        self._cache: Dict[tuple, Tuple[float, Any]] = {}
+    
+    def __getattr__(self, name: str):
+        attr = getattr(self._reader, name)
+        if name not in self._CACHED_METHODS:
+            return attr
+        
+        def cached(*args):
+            key = (name, *args)
+            now = time.monotonic()
+            hit = self._cache.get(key)
+            if hit is not None and now - hit[0] < self._ttl_s:
+                return hit[1]
+            value = attr(*args)
+            self._cache[key] = (now, value)
+            return value
+        return cached
+    
+    def invalidate(self) -> None:
+        """Drop all memoized results (after a write)."""
+        self._cache.clear()
+
+
 class PrivilegedController:
     """
     Controller that uses pkexec for privileged operations.
@@ -46,10 +123,18 @@ class PrivilegedController:
     Write operations call the helper script via pkexec.
     """
     
-    def __init__(self, gpu_index: int = 0):
+    def __init__(self, gpu_index: int = 0, cache_ttl_s: float = 0.2):
         self._gpu_index = gpu_index
-        self._reader: Optional[NVMLController] = None
-        self._pkexec_path = shutil.which("pkexec")
+        self._cache_ttl_s = cache_ttl_s
+        self._reader: Optional[_CachedReader] = None
+        self._sock: Optional[socket.socket] = None  # Connection to the helper daemon
+        self._started_daemon = False
+        self._daemon_failed = False  # Daemon couldn't start; use one-shot helpers
+        # The fan curve daemon writes from its own thread; calls share one socket
+        self._helper_lock = threading.Lock()
+        self._pkexec_path = _PKEXEC_PATH
+        # argv prefix shared by every helper launch
+        self._cmd_prefix = (self._pkexec_path or "pkexec", "python3", str(HELPER_SCRIPT))
         
         if not self._pkexec_path:
             logger.warning("pkexec not found, privileged operations may fail")
@@ -57,11 +142,20 @@ class PrivilegedController:
     def initialize(self) -> None:
         """Initialize the controller."""
         # Initialize reader for non-privileged operations
-        self._reader = NVMLController(self._gpu_index)
-        self._reader.initialize()
+        reader = NVMLController(self._gpu_index)
+        reader.initialize()
+        self._reader = _CachedReader(reader, self._cache_ttl_s)
     
     def shutdown(self) -> None:
         """Shutdown the controller."""
+        if self._sock is not None:
+            if self._started_daemon:
+                # The daemon was started for this session; stop it with us
+                try:
+                    self._send_frame({"cmd": "exit", "args": []})
+                except OSError:
+                    pass
+            self._close_daemon()
         if self._reader:
             self._reader.shutdown()
             self._reader = None
@@ -76,44 +170,71 @@ class PrivilegedController:
     
     def _run_helper(self, *args) -> Dict[str, Any]:
         """
-        Run the helper script via pkexec.
+        Run a helper command.
+        
+        Uses the helper daemon if its socket is available, otherwise
+        runs the helper script via pkexec.
         
         Returns the parsed JSON response.
         Raises PrivilegedControllerError on failure.
         """
-        if not HELPER_SCRIPT.exists():
+        try:
+            with self._helper_lock:
+                return self._call_helper(*args)
+        finally:
+            # Whatever the outcome, cached reads may no longer match the GPU
+            if self._reader:
+                self._reader.invalidate()
+    
+    def _call_helper(self, *args) -> Dict[str, Any]:
+        """Send a command to the helper daemon or a pkexec'd helper."""
+        if not self._daemon_failed:
+            try:
+                response = self._run_daemon(*args)
+            except socket.timeout:
+                # The write may already have been applied; re-sending it
+                # through a one-shot helper would repeat it and prompt again
+                raise PrivilegedControllerError("Helper daemon timed out")
+            except OSError as e:
+                logger.debug("Helper daemon unavailable (%s), falling back to pkexec", e)
+            else:
+                if not response.get("success"):
+                    raise PrivilegedControllerError(response.get("error", "Unknown error"))
+                return response
+        
+        if not _HELPER_OK:
             raise PrivilegedControllerError(f"Helper script not found: {HELPER_SCRIPT}")
         
-        cmd = [
-            self._pkexec_path or "pkexec",
-            "python3",
-            str(HELPER_SCRIPT),
-            *[str(a) for a in args]
-        ]
+        # One-shot fallback. Length-prefixed framing lives on the daemon
+        # socket (_send_frame); a one-shot helper keeps printing plain JSON
+        # so it stays usable from a shell, and its single small response is
+        # read whole by subprocess.run.
+        cmd = [*self._cmd_prefix, *map(str, args)]
         
-        logger.debug(f"Running helper: {' '.join(cmd)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running helper: %s", " ".join(cmd))
         
         try:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=30
             )
             
             if result.returncode != 0 and not result.stdout:
                 # pkexec was cancelled or failed before running helper
-                if "dismissed" in result.stderr.lower() or result.returncode == 126:
+                stderr = result.stderr.decode(errors="replace")
+                if "dismissed" in stderr.lower() or result.returncode == 126:
                     raise PrivilegedControllerError("Authentication cancelled")
                 raise PrivilegedControllerError(
-                    result.stderr or f"Helper failed with code {result.returncode}"
+                    stderr or f"Helper failed with code {result.returncode}"
                 )
             
-            # Parse JSON response
+            # Parse JSON response straight from the stdout bytes
             try:
-                response = json.loads(result.stdout)
-            except json.JSONDecodeError:
-                raise PrivilegedControllerError(f"Invalid helper response: {result.stdout}")
+                response = _json_loads(result.stdout)
+            except json.JSONDecodeError:  # orjson's error subclasses json's
+                raise PrivilegedControllerError(f"Invalid helper response: {result.stdout!r}")
             
             if not response.get("success"):
                 raise PrivilegedControllerError(response.get("error", "Unknown error"))
@@ -125,6 +246,121 @@ class PrivilegedController:
         except FileNotFoundError:
             raise PrivilegedControllerError("pkexec not found - install polkit")
     
+    def _ensure_daemon(self) -> socket.socket:
+        """
+        Return the connection to the helper daemon, starting it if needed.
+        
+        The daemon is launched once via pkexec (a single authentication
+        prompt) and then serves every write for the rest of the session.
+        
+        Raises:
+            PrivilegedControllerError: If authentication is cancelled
+            OSError: If the daemon cannot be reached or fails to start
+        """
+        if self._sock is not None:
+            return self._sock
+        
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(30)
+            try:
+                sock.connect(str(HELPER_SOCKET))
+            except (FileNotFoundError, ConnectionRefusedError):
+                # No daemon, or a stale socket left by one that died
+                HELPER_SOCKET.unlink(missing_ok=True)
+                self._start_daemon()
+                sock.connect(str(HELPER_SOCKET))
+        except BaseException:
+            sock.close()
+            raise
+        
+        self._sock = sock
+        return sock
+    
+    def _start_daemon(self) -> None:
+        """
+        Launch ``helper.py serve`` via pkexec and wait for its socket.
+        
+        If the daemon exits or never shows up, it is not tried again this
+        session and writes go through one-shot helpers instead.
+        
+        Raises:
+            PrivilegedControllerError: If authentication is cancelled
+            OSError: If the daemon fails to start
+        """
+        if not _HELPER_OK:
+            raise PrivilegedControllerError(f"Helper script not found: {HELPER_SCRIPT}")
+        
+        cmd = [*self._cmd_prefix, "serve", str(HELPER_SOCKET)]
+        logger.info("Starting helper daemon")
+        
+        try:
+            # The daemon outlives this call, so don't keep pipes it could fill
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError:
+            raise PrivilegedControllerError("pkexec not found - install polkit")
+        
+        deadline = time.monotonic() + DAEMON_START_TIMEOUT_S
+        while not HELPER_SOCKET.exists():
+            code = proc.poll()
+            if code is not None:
+                if code == 126:
+                    raise PrivilegedControllerError("Authentication cancelled")
+                self._daemon_failed = True
+                raise OSError(f"Helper daemon exited with code {code}")
+            if time.monotonic() > deadline:
+                proc.terminate()
+                self._daemon_failed = True
+                raise OSError("Timed out waiting for the helper daemon")
+            time.sleep(0.05)
+        
+        self._started_daemon = True
+    
+    def _close_daemon(self) -> None:
+        """Drop the daemon connection (it is re-opened on the next write)."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+    
+    def _send_frame(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one length-prefixed request and read the response frame."""
+        sock = self._ensure_daemon()
+        payload = json.dumps(request).encode()
+        sock.sendall(_FRAME_HEADER.pack(len(payload)) + payload)
+        (length,) = _FRAME_HEADER.unpack(_recv_exact(sock, _FRAME_HEADER.size))
+        body = _recv_exact(sock, length)
+        try:
+            return _json_loads(body)
+        except json.JSONDecodeError:
+            raise PrivilegedControllerError(f"Invalid helper response: {body!r}")
+    
+    def _run_daemon(self, command: str, *args) -> Dict[str, Any]:
+        """
+        Send one command to the helper daemon.
+        
+        Reconnects once if the daemon went away (e.g. it was restarted).
+        
+        Raises OSError if the daemon cannot be reached.
+        """
+        request = {"cmd": command, "args": [str(a) for a in args]}
+        logger.debug("Sending to helper daemon: %s", request)
+        
+        for attempt in range(2):
+            try:
+                return self._send_frame(request)
+            except ConnectionError:
+                self._close_daemon()
+                if attempt:
+                    raise
+            except OSError:
+                self._close_daemon()
+                raise
+    
     # =========================================================================
     # Read operations (no root needed, direct NVML)
     # =========================================================================
@@ -141,6 +377,12 @@ class PrivilegedController:
             raise PrivilegedControllerError("Controller not initialized")
         return self._reader.get_gpu_stats()
     
+    def get_status(self) -> GPUStatus:
+        """Get core live readings (no root needed)."""
+        if not self._reader:
+            raise PrivilegedControllerError("Controller not initialized")
+        return self._reader.get_status()
+    
     def get_power_limits(self) -> PowerLimits:
         """Get power limits (no root needed)."""
         if not self._reader:
@@ -171,6 +413,28 @@ class PrivilegedController:
             raise PrivilegedControllerError("Controller not initialized")
         self._reader.reset_peak_clock()
     
+    def start_background_sampler(
+        self,
+        interval_s: float = 1.0,
+        on_sample: Optional[Callable[[GPUStats], None]] = None,
+    ) -> None:
+        """Sample stats on a background thread (no root needed)."""
+        if not self._reader:
+            raise PrivilegedControllerError("Controller not initialized")
+        self._reader.start_background_sampler(interval_s, on_sample)
+    
+    def stop_background_sampler(self, wait: bool = True) -> None:
+        """Stop the background stats sampler."""
+        if self._reader:
+            self._reader.stop_background_sampler(wait)
+    
+    def stats_stream(self, interval_ms: int = 1000,
+                     stop: Optional[threading.Event] = None) -> Iterator[GPUStats]:
+        """Yield stats on GPU events or every interval_ms (no root needed)."""
+        if not self._reader:
+            raise PrivilegedControllerError("Controller not initialized")
+        return self._reader.stats_stream(interval_ms, stop)
+    
     # =========================================================================
     # Write operations (via pkexec helper)
     # =========================================================================
@@ -178,7 +442,7 @@ class PrivilegedController:
     def set_power_limit(self, watts: float) -> None:
         """Set power limit (requires authentication)."""
         self._run_helper("set-power-limit", watts)
-        logger.info(f"Power limit set to {watts}W")
+        logger.info("Power limit set to %sW", watts)
     
     def set_clock_offsets(
         self,
@@ -186,20 +450,17 @@ class PrivilegedController:
         memory_offset_mhz: Optional[int] = None
     ) -> Tuple[int, int]:
         """Set clock offsets (requires authentication)."""
-        # Get current values if not specified
-        if core_offset_mhz is None or memory_offset_mhz is None:
-            current = self.get_clock_offsets()
-            if core_offset_mhz is None:
-                core_offset_mhz = current.core_offset_mhz
-            if memory_offset_mhz is None:
-                memory_offset_mhz = current.memory_offset_mhz
-        
-        response = self._run_helper("set-clock-offsets", core_offset_mhz, memory_offset_mhz)
+        # "null" leaves that offset untouched; the helper fills it in itself
+        response = self._run_helper(
+            "set-clock-offsets",
+            "null" if core_offset_mhz is None else core_offset_mhz,
+            "null" if memory_offset_mhz is None else memory_offset_mhz,
+        )
         
         actual_core = response.get("core_offset", core_offset_mhz)
         actual_mem = response.get("memory_offset", memory_offset_mhz)
         
-        logger.info(f"Clock offsets set to core:{actual_core}MHz, mem:{actual_mem}MHz")
+        logger.info("Clock offsets set to core:%sMHz, mem:%sMHz", actual_core, actual_mem)
         return (actual_core, actual_mem)
     
     def reset_clock_offsets(self) -> None:
@@ -211,29 +472,36 @@ class PrivilegedController:
         """Set fan speed (requires authentication)."""
         response = self._run_helper("set-fan-speed", speed_percent, fan_index)
         actual = response.get("fan_speed", speed_percent)
-        logger.info(f"Fan {fan_index} set to {actual}%")
+        logger.info("Fan %s set to %s%%", fan_index, actual)
         return actual
     
     def set_fan_auto(self, fan_index: int = 0) -> None:
         """Set fan to auto mode (requires authentication)."""
         self._run_helper("set-fan-auto", fan_index)
-        logger.info(f"Fan {fan_index} set to auto")
+        logger.info("Fan %s set to auto", fan_index)
     
-    def set_all_fans_speed(self, speed_percent: int) -> None:
-        """Set all fans to the same speed."""
-        fan_count = self.get_fan_count()
-        for i in range(max(1, fan_count)):
-            self.set_fan_speed(speed_percent, fan_index=i)
+    def set_all_fans_speed(self, speed_percent: int) -> int:
+        """Set all fans to the same speed (one helper call for every fan)."""
+        response = self._run_helper("set-all-fans-speed", speed_percent)
+        actual = response.get("fan_speed", speed_percent)
+        logger.info("All fans set to %s%%", actual)
+        return actual
     
     def set_all_fans_auto(self) -> None:
-        """Set all fans to automatic control."""
-        fan_count = self.get_fan_count()
-        for i in range(max(1, fan_count)):
-            self.set_fan_auto(fan_index=i)
-    
-    def apply_profile(self, profile_dict: Dict[str, Any]) -> None:
-        """Apply a complete profile (requires authentication)."""
-        self._run_helper("apply-profile", json.dumps(profile_dict))
+        """Set all fans to automatic control (one helper call for every fan)."""
+        self._run_helper("set-all-fans-auto")
+        logger.info("All fans set to auto")
+    
+    def apply_profile(self, profile: Union[Dict[str, Any], str]) -> None:
+        """
+        Apply a complete profile (requires authentication).
+        
+        Args:
+            profile: Profile dict, or already-serialized profile JSON
+        """
+        if not isinstance(profile, str):
+            profile = json.dumps(profile)
+        self._run_helper("apply-profile", profile)
         logger.info("Profile applied")
     
     # =========================================================================
@@ -262,4 +530,4 @@ class PrivilegedController:
     def set_gpu_locked_clocks(self, min_mhz: int, max_mhz: int) -> None:
         """Set locked clocks (requires authentication)."""
         self._run_helper("set-locked-clocks", min_mhz, max_mhz)
-        logger.info(f"Locked clocks set to {min_mhz}-{max_mhz} MHz")
+        logger.info("Locked clocks set to %s-%s MHz", min_mhz, max_mhz)
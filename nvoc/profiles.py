@@ -7,10 +7,20 @@ Profiles are stored as JSON files in ~/.config/nvoc/profiles/
 
 import json
 import logging
+import os
+import re
+import shutil
+import tempfile
+import time
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json is the fallback
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -19,9 +29,26 @@ CONFIG_DIR = Path.home() / ".config" / "nvoc"
 PROFILES_DIR = CONFIG_DIR / "profiles"
 
 
-@dataclass
+def _timestamp() -> str:
+    """Local time as an ISO 8601 string (second precision)."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _loads(blob: bytes) -> Any:
+    """Parse JSON from raw file bytes."""
+    return orjson.loads(blob) if orjson is not None else json.loads(blob)
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize to indented JSON bytes (fan curve keys become strings)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode()
+
+
+@dataclass(frozen=True, slots=True)
 class Profile:
-    """Overclock profile data structure."""
+    """Overclock profile data structure (immutable; derive changes with replace())."""
     name: str
     power_limit_watts: Optional[float] = None
     core_clock_offset_mhz: Optional[int] = None
@@ -37,7 +64,10 @@ class Profile:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert profile to dictionary."""
-        return asdict(self)
+        data = {name: getattr(self, name) for name in _PROFILE_FIELDS}
+        if self.fan_curve is not None:
+            data["fan_curve"] = dict(self.fan_curve)  # Flat int -> int map
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Profile":
@@ -59,6 +89,20 @@ class Profile:
         )
 
 
+# Field names in declaration order; to_dict() avoids asdict()'s recursive copy
+_PROFILE_FIELDS = tuple(f.name for f in fields(Profile))
+
+
+# Anything but letters, digits (Unicode, like str.isalnum) and "._- "
+_UNSAFE_CHARS = re.compile(r"[^\w.\- ]")
+
+
+@lru_cache(maxsize=256)
+def _sanitize(name: str) -> str:
+    """Turn a profile name into a safe filename stem."""
+    return _UNSAFE_CHARS.sub("", name).strip().replace(" ", "_").lower()
+
+
 class ProfileManager:
     """
     Manages overclock profiles - save, load, delete, list.
@@ -74,6 +118,8 @@ class ProfileManager:
             profiles_dir: Custom profiles directory (default: ~/.config/nvoc/profiles/)
         """
         self.profiles_dir = profiles_dir or PROFILES_DIR
+        # path -> (st_mtime_ns, display name) for list_profiles()
+        self._name_index: Dict[str, Tuple[int, str]] = {}
         self._ensure_directories()
     
     def _ensure_directories(self) -> None:
@@ -82,10 +128,7 @@ class ProfileManager:
     
     def _get_profile_path(self, name: str) -> Path:
         """Get the file path for a profile."""
-        # Sanitize name for filename
-        safe_name = "".join(c for c in name if c.isalnum() or c in "._- ").strip()
-        safe_name = safe_name.replace(" ", "_").lower()
-        return self.profiles_dir / f"{safe_name}.json"
+        return self.profiles_dir / f"{_sanitize(name)}.json"
     
     def list_profiles(self) -> List[str]:
         """
@@ -94,15 +137,27 @@ class ProfileManager:
         Returns:
             List of profile names
         """
-        profiles = []
-        for path in self.profiles_dir.glob("*.json"):
-            try:
-                with open(path, 'r') as f:
-                    data = json.load(f)
-                    profiles.append(data.get("name", path.stem))
-            except (json.JSONDecodeError, IOError):
-                logger.warning(f"Could not read profile: {path}")
-        return sorted(profiles)
+        # Only files whose mtime changed since the last call are re-parsed
+        index = {}
+        with os.scandir(self.profiles_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+                cached = self._name_index.get(entry.path)
+                if cached is not None and cached[0] == mtime:
+                    index[entry.path] = cached
+                    continue
+                try:
+                    data = _loads(Path(entry.path).read_bytes())
+                    index[entry.path] = (mtime, data.get("name", entry.name[:-5]))
+                except (json.JSONDecodeError, IOError):
+                    logger.warning(f"Could not read profile: {entry.path}")
+        self._name_index = index
+        return sorted(name for _, name in index.values())
     
     def load_profile(self, name: str) -> Optional[Profile]:
         """
@@ -121,39 +176,61 @@ class ProfileManager:
             return None
         
         try:
-            with open(path, 'r') as f:
-                data = json.load(f)
-            return Profile.from_dict(data)
-        except (json.JSONDecodeError, IOError) as e:
+            return Profile.from_dict(_loads(path.read_bytes()))
+        except (json.JSONDecodeError, IOError) as e:  # orjson's error subclasses json's
             logger.error(f"Failed to load profile {name}: {e}")
             return None
     
-    def save_profile(self, profile: Profile) -> bool:
+    def get_profile_by_name(self, name: str) -> Optional[Profile]:
+        """
+        Look up a profile by display name, falling back to built-in profiles.
+        
+        Args:
+            name: Profile name
+            
+        Returns:
+            Profile object or None if not found
+        """
+        return self.load_profile(name) or BUILTIN_PROFILES_BY_NAME.get(name)
+    
+    def save_profile(self, profile: Profile) -> Optional[Profile]:
         """
         Save a profile.
         
+        The file is written to a temporary sibling and renamed into place,
+        so readers never see a half-written profile.
+        
         Args:
             profile: Profile object to save
             
         Returns:
-            True if successful
+            The saved profile with its timestamps filled in, or None on failure
         """
         path = self._get_profile_path(profile.name)
         
         # Update timestamps
-        now = datetime.now().isoformat()
-        if not profile.created_at:
-            profile.created_at = now
-        profile.updated_at = now
+        now = _timestamp()
+        profile = replace(profile, created_at=profile.created_at or now, updated_at=now)
         
+        tmp_path = None
         try:
-            with open(path, 'w') as f:
-                json.dump(profile.to_dict(), f, indent=2)
+            # No .json suffix on the temp file, so list_profiles() skips it
+            with tempfile.NamedTemporaryFile(
+                dir=self.profiles_dir, prefix=".profile-", delete=False
+            ) as f:
+                tmp_path = f.name
+                f.write(_dumps(profile.to_dict()))
+            os.replace(tmp_path, path)
             logger.info(f"Profile saved: {profile.name}")
-            return True
+            return profile
         except IOError as e:
             logger.error(f"Failed to save profile {profile.name}: {e}")
-            return False
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            return None
     
     def delete_profile(self, name: str) -> bool:
         """
@@ -213,14 +290,27 @@ class ProfileManager:
         """
         Apply a profile to the GPU.
         
+        Controllers that accept a whole profile (PrivilegedController) get it
+        in one call, i.e. one helper round trip; others are driven setting by
+        setting.
+        
         Args:
             profile: Profile to apply
-            controller: NVMLController instance
+            controller: NVMLController or PrivilegedController instance
             
         Returns:
             True if successful
         """
         try:
+            if hasattr(controller, "apply_profile"):
+                # Built-ins are constants, so their JSON is serialized once
+                payload = get_builtin_json(profile.name)
+                if payload is None or BUILTIN_PROFILES_BY_NAME[profile.name] is not profile:
+                    payload = profile.to_dict()
+                controller.apply_profile(payload)
+                logger.info(f"Applied profile: {profile.name}")
+                return True
+            
             # Apply power limit
             if profile.power_limit_watts is not None:
                 controller.set_power_limit(profile.power_limit_watts)
@@ -253,17 +343,31 @@ class ProfileManager:
             logger.error(f"Failed to apply profile {profile.name}: {e}")
             return False
     
-    def export_profile(self, name: str, export_path: Path) -> bool:
+    def export_profile(self, name: str, export_path: Path, wrapped: bool = True) -> bool:
         """
         Export a profile to an external JSON file.
         
         Args:
             name: Profile name to export
             export_path: Destination file path
+            wrapped: Add the nvoc_version/export_date envelope; without it
+                the stored file is copied as-is (import accepts both)
             
         Returns:
             True if successful
         """
+        if not wrapped:
+            try:
+                shutil.copyfile(self._get_profile_path(name), export_path)
+                logger.info(f"Exported profile '{name}' to {export_path}")
+                return True
+            except FileNotFoundError:
+                logger.error(f"Cannot export: profile '{name}' not found")
+                return False
+            except IOError as e:
+                logger.error(f"Failed to export profile: {e}")
+                return False
+        
         profile = self.load_profile(name)
         if profile is None:
             logger.error(f"Cannot export: profile '{name}' not found")
@@ -272,11 +376,10 @@ class ProfileManager:
         try:
             export_data = {
                 "nvoc_version": "1.0",
-                "export_date": datetime.now().isoformat(),
+                "export_date": _timestamp(),
                 "profile": profile.to_dict()
             }
-            with open(export_path, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            Path(export_path).write_bytes(_dumps(export_data))
             logger.info(f"Exported profile '{name}' to {export_path}")
             return True
         except IOError as e:
@@ -295,8 +398,7 @@ class ProfileManager:
             Imported Profile object or None if failed
         """
         try:
-            with open(import_path, 'r') as f:
-                data = json.load(f)
+            data = _loads(Path(import_path).read_bytes())
             
             # Handle both exported format and raw profile format
             if "profile" in data:
@@ -313,10 +415,10 @@ class ProfileManager:
                 return None
             
             # Save the imported profile
-            if self.save_profile(profile):
+            saved = self.save_profile(profile)
+            if saved is not None:
                 logger.info(f"Imported profile '{profile.name}' from {import_path}")
-                return profile
-            return None
+            return saved
             
         except (json.JSONDecodeError, IOError) as e:
             logger.error(f"Failed to import profile: {e}")
@@ -328,16 +430,31 @@ class DefaultProfileManager:
     
     DEFAULT_PROFILE_FILE = CONFIG_DIR / "default_profile.txt"
     
+    # Cached result of get_default(); _UNSET until the file has been read
+    _UNSET = object()
+    _cached_default: Any = _UNSET
+    
     @classmethod
     def get_default(cls) -> Optional[str]:
-        """Get the name of the default profile."""
+        """Get the name of the default profile (read once per process)."""
+        if cls._cached_default is not cls._UNSET:
+            return cls._cached_default
+        
         if not cls.DEFAULT_PROFILE_FILE.exists():
-            return None
+            default = None
+        else:
+            try:
+                default = cls.DEFAULT_PROFILE_FILE.read_text().strip()
+            except IOError:
+                return None  # Don't cache a transient read failure
         
-        try:
-            return cls.DEFAULT_PROFILE_FILE.read_text().strip()
-        except IOError:
-            return None
+        cls._cached_default = default
+        return default
+    
+    @classmethod
+    def invalidate(cls) -> None:
+        """Forget the cached default so the next get_default() re-reads the file."""
+        cls._cached_default = cls._UNSET
     
     @classmethod
     def set_default(cls, profile_name: str) -> bool:
@@ -345,6 +462,7 @@ class DefaultProfileManager:
         try:
             CONFIG_DIR.mkdir(parents=True, exist_ok=True)
             cls.DEFAULT_PROFILE_FILE.write_text(profile_name)
+            cls.invalidate()
             logger.info(f"Default profile set to: {profile_name}")
             return True
         except IOError as e:
@@ -357,6 +475,7 @@ class DefaultProfileManager:
         if cls.DEFAULT_PROFILE_FILE.exists():
             try:
                 cls.DEFAULT_PROFILE_FILE.unlink()
+                cls.invalidate()
                 logger.info("Default profile cleared")
                 return True
             except IOError as e:
@@ -393,3 +512,16 @@ BUILTIN_PROFILES = {
         description="Moderate overclock for extra performance"
     ),
 }
+
+# Built-in profiles keyed by display name
+BUILTIN_PROFILES_BY_NAME = {p.name: p for p in BUILTIN_PROFILES.values()}
+
+# Built-in profiles pre-serialized for the helper, keyed by display name
+_BUILTIN_JSON: Dict[str, str] = {
+    name: json.dumps(p.to_dict()) for name, p in BUILTIN_PROFILES_BY_NAME.items()
+}
+
+
+def get_builtin_json(name: str) -> Optional[str]:
+    """Return the helper-ready JSON for a built-in profile, or None."""
+    return _BUILTIN_JSON.get(name)
@@ -2,12 +2,20 @@
 NVOC - UI Package
 
 GTK4 user interface components.
+
+Pages are imported on first attribute access (PEP 562), so importing one
+submodule such as ``nvoc.ui.dashboard`` doesn't load the others.
 """
 
-from .dashboard import DashboardPage
-from .overclock import OverclockPage
-from .fans import FansPage
-from .profiles_view import ProfilesPage
+import importlib
+
+# Exported name -> submodule that defines it
+_PAGES = {
+    "DashboardPage": ".dashboard",
+    "OverclockPage": ".overclock",
+    "FansPage": ".fans",
+    "ProfilesPage": ".profiles_view",
+}
 
 __all__ = [
     "DashboardPage",
@@ -15,3 +23,16 @@ __all__ = [
     "FansPage",
     "ProfilesPage",
 ]
+
+
+def __getattr__(name: str):
+    module = _PAGES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
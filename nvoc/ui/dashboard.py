@@ -12,8 +12,10 @@ gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 from gi.repository import Gtk, Adw, GLib, Gdk
 import cairo
-from collections import deque
-from typing import Optional
+import weakref
+from array import array
+from math import pi, tau
+from typing import List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,130 +30,256 @@ COLORS = {
     'grid': (0.141, 0.165, 0.212),    # #242A36
 }
 
+# Ease-out cubic (1 - (1 - t)^3) sampled at 33 points; interpolated in between
+_EASE_STEPS = 32
+_EASE_OUT_CUBIC_LUT = array('d', [1 - (1 - i / _EASE_STEPS) ** 3 for i in range(_EASE_STEPS + 1)])
+
+
+class _DirtyRegistry:
+    """
+    Sparklines waiting for a redraw, flushed together on the next frame.
+    
+    update_stats() feeds every card in one pass; instead of one
+    queue_draw() per sparkline, one tick callback invalidates them all
+    in step with the frame clock. The callback removes itself, so the
+    clock isn't kept ticking while nothing changes.
+    """
+    
+    _dirty: "weakref.WeakSet[Sparkline]" = weakref.WeakSet()
+    _scheduled = False
+    
+    @classmethod
+    def mark(cls, widget: "Sparkline") -> None:
+        cls._dirty.add(widget)
+        if not cls._scheduled:
+            cls._scheduled = True
+            widget.add_tick_callback(cls._flush)
+    
+    @classmethod
+    def _flush(cls, widget, frame_clock) -> bool:
+        cls._scheduled = False
+        dirty = list(cls._dirty)
+        cls._dirty.clear()
+        for sparkline in dirty:
+            if sparkline.get_mapped():
+                sparkline.queue_draw()
+        return GLib.SOURCE_REMOVE
+
 
 class Sparkline(Gtk.DrawingArea):
     """Compact 60-second sparkline graph."""
     
     def __init__(self, color_key: str = 'clocks', max_points: int = 60):
         super().__init__()
-        self.data = deque(maxlen=max_points)
+        # Ring buffer of float32 samples; _head is the next slot to write
+        self._buf = array('f', bytes(4 * max_points))
+        self._head = 0
+        self._count = 0
         self.color = COLORS.get(color_key, COLORS['clocks'])
+        # Polyline cached per (width, height); cleared when data changes
+        self._points: Optional[List[Tuple[float, float]]] = None
+        self._points_size = (0, 0)
+        # x coordinates only depend on width and sample count, so they
+        # survive new samples once the buffer is full
+        self._xs: List[float] = []
+        self._xs_key = (0, 0)
+        # Rounded-rect clip, rebuilt only on resize
+        self._clip_path = None
+        self._clip_size = (0, 0)
         self.set_content_width(120)
         self.set_content_height(32)
         self.set_draw_func(self._draw)
     
+    @property
+    def data(self) -> array:
+        """Samples in chronological order, oldest first."""
+        if self._count < len(self._buf):
+            return self._buf[:self._count]
+        return self._buf[self._head:] + self._buf[:self._head]
+    
     def add_value(self, value: float) -> None:
-        self.data.append(value)
-        self.queue_draw()
+        self._buf[self._head] = value
+        self._head = (self._head + 1) % len(self._buf)
+        self._count = min(self._count + 1, len(self._buf))
+        self._points = None
+        # Hidden (e.g. another page is showing): keep the history, skip the
+        # redraw; mapping the widget draws it anyway
+        if self.get_mapped():
+            _DirtyRegistry.mark(self)
+    
+    def _get_points(self, width: int, height: int) -> List[Tuple[float, float]]:
+        """Scale the samples to widget coordinates (cached until data or size changes)."""
+        if self._points is None or self._points_size != (width, height):
+            data = self.data
+            count = len(data)
+            if self._xs_key != (width, count):
+                x_step = width / (count - 1)
+                self._xs = [i * x_step for i in range(count)]
+                self._xs_key = (width, count)
+            
+            min_val = min(data)
+            range_val = max(max(data) - min_val, 1)
+            y_scale = (height - 4) / range_val
+            # Fold the offsets into one constant: y = y_base - val * y_scale
+            y_base = height - 2 + min_val * y_scale
+            self._points = list(zip(self._xs, [y_base - val * y_scale for val in data]))
+            self._points_size = (width, height)
+        return self._points
     
     def _draw(self, area, cr, width, height) -> None:
-        if len(self.data) < 2:
+        if self._count < 2:
             return
         
         # Clip to rounded rectangle
-        radius = 6
         cr.new_path()
-        cr.arc(radius, radius, radius, 3.14159, 1.5 * 3.14159)
-        cr.arc(width - radius, radius, radius, 1.5 * 3.14159, 0)
-        cr.arc(width - radius, height - radius, radius, 0, 0.5 * 3.14159)
-        cr.arc(radius, height - radius, radius, 0.5 * 3.14159, 3.14159)
-        cr.close_path()
+        if self._clip_path is None or self._clip_size != (width, height):
+            radius = 6
+            cr.arc(radius, radius, radius, pi, 1.5 * pi)
+            cr.arc(width - radius, radius, radius, 1.5 * pi, tau)
+            cr.arc(width - radius, height - radius, radius, 0, 0.5 * pi)
+            cr.arc(radius, height - radius, radius, 0.5 * pi, pi)
+            cr.close_path()
+            # Flattened once, so later frames skip the arc tessellation
+            self._clip_path = cr.copy_path_flat()
+            self._clip_size = (width, height)
+        else:
+            cr.append_path(self._clip_path)
         cr.clip()
         
-        # Background
+        # Background (fills the clip)
         cr.set_source_rgb(*COLORS['grid'])
-        cr.rectangle(0, 0, width, height)
-        cr.fill()
+        cr.paint()
         
-        # Calculate bounds
-        min_val = min(self.data)
-        max_val = max(self.data)
-        range_val = max(max_val - min_val, 1)
+        # Build the polyline once and stroke it twice
+        points = self._get_points(width, height)
+        cr.move_to(*points[0])
+        for x, y in points[1:]:
+            cr.line_to(x, y)
+        
+        # Glow effect (underneath, keeping the path for the line)
+        cr.set_source_rgba(*self.color, 0.15)
+        cr.set_line_width(6)
+        cr.stroke_preserve()
         
         # Draw line
         cr.set_source_rgba(*self.color, 0.9)
         cr.set_line_width(2)
-        
-        points = list(self.data)
-        for i, val in enumerate(points):
-            x = (i / (len(points) - 1)) * width
-            y = height - ((val - min_val) / range_val) * (height - 4) - 2
-            
-            if i == 0:
-                cr.move_to(x, y)
-            else:
-                cr.line_to(x, y)
-        
-        cr.stroke()
-        
-        # Glow effect
-        cr.set_source_rgba(*self.color, 0.15)
-        cr.set_line_width(6)
-        for i, val in enumerate(points):
-            x = (i / (len(points) - 1)) * width
-            y = height - ((val - min_val) / range_val) * (height - 4) - 2
-            if i == 0:
-                cr.move_to(x, y)
-            else:
-                cr.line_to(x, y)
         cr.stroke()
 
 
+class _LabelAnimator:
+    """
+    Advances every running AnimatedLabel from one tick callback.
+    
+    The callback lives on the toplevel window and reads the frame time
+    once per frame for all labels; it removes itself when the last
+    animation finishes.
+    """
+    
+    _active: "set[AnimatedLabel]" = set()
+    _scheduled = False
+    
+    @classmethod
+    def start(cls, label: "AnimatedLabel") -> bool:
+        """Add a label to the running set; False if it has no window yet."""
+        cls._active.add(label)
+        if not cls._scheduled:
+            root = label.get_root()
+            if root is None:
+                cls._active.discard(label)
+                return False
+            cls._scheduled = True
+            root.add_tick_callback(cls._tick)
+        return True
+    
+    @classmethod
+    def stop(cls, label: "AnimatedLabel") -> None:
+        cls._active.discard(label)
+    
+    @classmethod
+    def _tick(cls, widget, frame_clock) -> bool:
+        now = frame_clock.get_frame_time() // 1000  # ms
+        for label in list(cls._active):
+            if label._advance(now):
+                cls._active.discard(label)
+        if cls._active:
+            return GLib.SOURCE_CONTINUE
+        cls._scheduled = False
+        return GLib.SOURCE_REMOVE
+
+
 class AnimatedLabel(Gtk.Label):
     """A label that animates numeric value changes with smooth interpolation.
     
-    Uses GLib.timeout_add for ~60fps updates with ease-out cubic easing.
+    Frame-clock driven through _LabelAnimator, so all labels update together
+    in step with the compositor. Ease-out cubic easing.
     Duration: 180ms to match unified motion language.
     """
     
-    def __init__(self, format_str: str = "{:.0f}", **kwargs):
+    def __init__(self, format_str: str = "{:.0f}", min_delta: float = 0.5, **kwargs):
+        """
+        Args:
+            format_str: Format applied to the (interpolated) value
+            min_delta: Changes smaller than this are shown without animating
+        """
         super().__init__(**kwargs)
         self._format = format_str
+        self.min_delta = min_delta
         self._current_value = 0.0
         self._target_value = 0.0
         self._start_value = 0.0
-        self._animation_id = None
+        self._last_text: Optional[str] = None  # Last string handed to set_label
         self._animation_start = 0
         self._animation_duration = 180  # ms, matches motion tokens
-        self._frame_interval = 16  # ~60fps
     
     def set_animated_value(self, value: float) -> None:
         """Set target value and start animation."""
-        if self._animation_id:
-            GLib.source_remove(self._animation_id)
-            self._animation_id = None
-        
-        # Don't animate tiny changes
-        if abs(value - self._current_value) < 0.5:
-            self._current_value = value
-            self._target_value = value
-            self.set_label(self._format.format(value))
-            return
-        
         self._start_value = self._current_value
         self._target_value = value
-        self._animation_start = GLib.get_monotonic_time() // 1000  # ms
-        self._animation_id = GLib.timeout_add(self._frame_interval, self._animate_step)
+        # Start time is taken from the first frame
+        self._animation_start = None
+        
+        # Don't animate tiny changes, or labels nobody can see
+        if (abs(value - self._start_value) < self.min_delta or not self.get_mapped()
+                or not _LabelAnimator.start(self)):
+            _LabelAnimator.stop(self)
+            self._current_value = value
+            self._set_text(self._format.format(value))
     
     def _ease_out_cubic(self, t: float) -> float:
-        """Ease-out cubic: decelerating to zero velocity."""
-        return 1 - pow(1 - t, 3)
+        """Ease-out cubic: decelerating to zero velocity (table lookup)."""
+        i = t * _EASE_STEPS
+        lo = int(i)
+        if lo >= _EASE_STEPS:
+            return 1.0
+        a = _EASE_OUT_CUBIC_LUT[lo]
+        return a + (_EASE_OUT_CUBIC_LUT[lo + 1] - a) * (i - lo)
+    
+    def _set_text(self, text: str) -> None:
+        """Update the label only when the visible text changes."""
+        if text != self._last_text:
+            self.set_label(text)
     
-    def _animate_step(self) -> bool:
-        """Animation frame callback."""
-        now = GLib.get_monotonic_time() // 1000
+    def set_label(self, text: str) -> None:
+        # Direct set_label() calls ("--", plain strings) reset the cache
+        self._last_text = text
+        super().set_label(text)
+    
+    def _advance(self, now: int) -> bool:
+        """Move the animation to frame time now (ms); True when finished."""
+        if self._animation_start is None:
+            self._animation_start = now
         elapsed = now - self._animation_start
         progress = min(elapsed / self._animation_duration, 1.0)
         
         eased = self._ease_out_cubic(progress)
         self._current_value = self._start_value + (self._target_value - self._start_value) * eased
-        self.set_label(self._format.format(self._current_value))
+        self._set_text(self._format.format(self._current_value))
         
         if progress >= 1.0:
             self._current_value = self._target_value
-            self._animation_id = None
-            return False  # Stop animation
-        return True  # Continue
+            return True  # Stop animation
+        return False
 
 
 class MetricCard(Gtk.Box):
@@ -181,8 +309,9 @@ class MetricCard(Gtk.Box):
         value_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
         value_box.set_halign(Gtk.Align.START)
         
-        # Use AnimatedLabel for smooth value transitions
-        self.value_label = AnimatedLabel(format_str="{:.0f}")
+        # Use AnimatedLabel for smooth value transitions; live metrics jitter
+        # every sample, so only animate real jumps
+        self.value_label = AnimatedLabel(format_str="{:.0f}", min_delta=5.0)
         self.value_label.set_label("--")
         self.value_label.add_css_class("metric-value")
         value_box.append(self.value_label)
@@ -216,6 +345,14 @@ class MetricCard(Gtk.Box):
 class TemperatureHero(Gtk.Box):
     """Premium temperature display with dynamic colors and Thermal State."""
     
+    # state -> (hero CSS class, badge CSS class, badge text)
+    _THERMAL_STATES = {
+        "cool": ("temp-cool", "badge-cool", "● Cool"),
+        "warm": ("temp-warm", "badge-warm", "● Normal"),
+        "hot": ("temp-hot", "badge-hot", "● Hot"),
+        "critical": ("temp-critical", "badge-critical", "⚠ Throttling"),
+    }
+    
     def __init__(self):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=8)
         self.add_css_class("temp-gauge")
@@ -230,7 +367,7 @@ class TemperatureHero(Gtk.Box):
         temp_row.set_halign(Gtk.Align.CENTER)
         
         # Use AnimatedLabel for smooth temperature transitions
-        self.temp_label = AnimatedLabel(format_str="{:.0f}")
+        self.temp_label = AnimatedLabel(format_str="{:.0f}", min_delta=1.0)
         self.temp_label.set_label("--")
         self.temp_label.add_css_class("temp-value-hero")
         temp_row.append(self.temp_label)
@@ -272,38 +409,28 @@ class TemperatureHero(Gtk.Box):
         else:
             new_state = "critical"
         
-        # Check if state changed
+        # Check if state changed; the CSS below only needs touching then
         old_state = getattr(self, '_current_state', None)
-        state_changed = old_state is not None and old_state != new_state
+        if new_state == old_state:
+            return
+        state_changed = old_state is not None
         self._current_state = new_state
         
         # Remove old classes
-        for cls in ["temp-cool", "temp-warm", "temp-hot", "temp-critical"]:
-            self.remove_css_class(cls)
-        for cls in ["badge-cool", "badge-warm", "badge-hot", "badge-critical"]:
-            self.status_badge.remove_css_class(cls)
+        if old_state is not None:
+            css_class, badge_class, _ = self._THERMAL_STATES[old_state]
+            self.remove_css_class(css_class)
+            self.status_badge.remove_css_class(badge_class)
         
         # Apply thermal state with pulse if changed
         if state_changed:
             self.status_badge.add_css_class("chip-pulse")
             GLib.timeout_add(300, self._remove_pulse)
         
-        if new_state == "cool":
-            self.add_css_class("temp-cool")
-            self.status_badge.add_css_class("badge-cool")
-            self.status_badge.set_label("● Cool")
-        elif new_state == "warm":
-            self.add_css_class("temp-warm")
-            self.status_badge.add_css_class("badge-warm")
-            self.status_badge.set_label("● Normal")
-        elif new_state == "hot":
-            self.add_css_class("temp-hot")
-            self.status_badge.add_css_class("badge-hot")
-            self.status_badge.set_label("● Hot")
-        else:
-            self.add_css_class("temp-critical")
-            self.status_badge.add_css_class("badge-critical")
-            self.status_badge.set_label("⚠ Throttling")
+        css_class, badge_class, badge_label = self._THERMAL_STATES[new_state]
+        self.add_css_class(css_class)
+        self.status_badge.add_css_class(badge_class)
+        self.status_badge.set_label(badge_label)
     
     def _remove_pulse(self) -> bool:
         """Remove pulse class after animation completes."""
@@ -336,23 +463,28 @@ class UtilizationBar(Gtk.Box):
         self.progress_bar = Gtk.ProgressBar()
         self.progress_bar.set_hexpand(True)
         self.append(self.progress_bar)
+        self._last_bucket: Optional[str] = None
     
     def set_value(self, fraction: float, label: str = "") -> None:
         self.progress_bar.set_fraction(max(0.0, min(1.0, fraction)))
         self.value_label.set_label(label if label else f"{int(fraction * 100)}%")
         
         # Color coding
-        for cls in ["progress-low", "progress-medium", "progress-high", "progress-critical"]:
-            self.progress_bar.remove_css_class(cls)
-        
         if fraction < 0.5:
-            self.progress_bar.add_css_class("progress-low")
+            bucket = "progress-low"
         elif fraction < 0.7:
-            self.progress_bar.add_css_class("progress-medium")
+            bucket = "progress-medium"
         elif fraction < 0.85:
-            self.progress_bar.add_css_class("progress-high")
+            bucket = "progress-high"
         else:
-            self.progress_bar.add_css_class("progress-critical")
+            bucket = "progress-critical"
+        
+        # Only touch the style context when the bucket changes
+        if bucket != self._last_bucket:
+            if self._last_bucket is not None:
+                self.progress_bar.remove_css_class(self._last_bucket)
+            self.progress_bar.add_css_class(bucket)
+            self._last_bucket = bucket
 
 
 class DashboardPage(Gtk.Box):
@@ -540,6 +672,9 @@ class DashboardPage(Gtk.Box):
         main_content.append(right_col)
         self.append(main_content)
         
+        # Labels aren't refreshed while the page is hidden; catch up on show
+        self.connect("map", self._on_map)
+        
         # Initial load
         self._load_gpu_info()
     
@@ -573,53 +708,75 @@ class DashboardPage(Gtk.Box):
         
         try:
             stats = self.controller.get_gpu_stats()
-            offsets = self.controller.get_clock_offsets()
             
-            # Temperature hero
-            self.temp_hero.set_temperature(stats.temperature_celsius)
-            
-            # Metric cards with sparklines
-            self.power_card.set_value(f"{stats.power_draw_watts:.0f}", stats.power_draw_watts)
-            power_pct = (stats.power_draw_watts / stats.power_limit_watts * 100) if stats.power_limit_watts > 0 else 0
-            self.power_card.set_subtitle(f"{power_pct:.0f}% of {stats.power_limit_watts:.0f}W limit")
-            
-            self.clocks_card.set_value(str(stats.core_clock_mhz), stats.core_clock_mhz)
-            self.clocks_card.set_subtitle(f"Mem: {stats.memory_clock_mhz} MHz")
-            
-            self.fan_card.set_value(str(stats.fan_speed_percent), stats.fan_speed_percent)
-            if stats.fan_speed_percent == 0:
-                self.fan_card.set_subtitle("Zero-RPM Mode")
-            else:
-                self.fan_card.set_subtitle("")
+            # Sparklines take exactly one sample per tick, hidden or not
+            self.power_card.sparkline.add_value(stats.power_draw_watts)
+            self.clocks_card.sparkline.add_value(stats.core_clock_mhz)
+            self.fan_card.sparkline.add_value(stats.fan_speed_percent)
+            self.vram_card.sparkline.add_value(stats.memory_used_mb)
             
-            self.vram_card.set_value(str(stats.memory_used_mb), stats.memory_used_mb)
-            self.vram_card.set_subtitle(f"of {stats.memory_total_mb} MB")
-            
-            # Utilization bars
-            self.gpu_util.set_value(stats.gpu_utilization_percent / 100.0)
-            self.vram_util.set_value(
-                stats.memory_used_mb / stats.memory_total_mb if stats.memory_total_mb > 0 else 0,
-                f"{stats.memory_used_mb}MB / {stats.memory_total_mb}MB"
-            )
-            
-            # Offsets
-            core_sign = "+" if offsets.core_offset_mhz >= 0 else ""
-            mem_sign = "+" if offsets.memory_offset_mhz >= 0 else ""
-            self.core_offset_label.set_label(f"Core {core_sign}{offsets.core_offset_mhz} MHz")
-            self.mem_offset_label.set_label(f"Memory {mem_sign}{offsets.memory_offset_mhz} MHz")
-            
-            # Status chip
-            is_active = stats.gpu_utilization_percent > 50
-            self.status_chip.set_label("Active" if is_active else "Idle")
-            self.status_chip.remove_css_class("chip-active")
-            self.status_chip.remove_css_class("chip-idle")
-            self.status_chip.add_css_class("chip-active" if is_active else "chip-idle")
+            # Page hidden: skip the label, CSS and animation work
+            if self.get_mapped():
+                self._refresh_labels(stats)
             
         except Exception as e:
             logger.error(f"Failed to update stats: {e}")
         finally:
             self._updating = False
     
+    def _on_map(self, widget) -> None:
+        """Bring labels up to date on show, without adding a sparkline sample."""
+        if not self.controller:
+            return
+        try:
+            self._refresh_labels(self.controller.get_gpu_stats())
+        except Exception as e:
+            logger.error(f"Failed to update stats: {e}")
+    
+    def _refresh_labels(self, stats) -> None:
+        """Update everything except the sparklines from one stats sample."""
+        offsets = self.controller.get_clock_offsets()
+        
+        # Temperature hero
+        self.temp_hero.set_temperature(stats.temperature_celsius)
+        
+        # Metric cards (sparklines are fed by update_stats)
+        self.power_card.set_value(stats.power_draw_watts)
+        power_pct = (stats.power_draw_watts / stats.power_limit_watts * 100) if stats.power_limit_watts > 0 else 0
+        self.power_card.set_subtitle(f"{power_pct:.0f}% of {stats.power_limit_watts:.0f}W limit")
+        
+        self.clocks_card.set_value(stats.core_clock_mhz)
+        self.clocks_card.set_subtitle(f"Mem: {stats.memory_clock_mhz} MHz")
+        
+        self.fan_card.set_value(stats.fan_speed_percent)
+        if stats.fan_speed_percent == 0:
+            self.fan_card.set_subtitle("Zero-RPM Mode")
+        else:
+            self.fan_card.set_subtitle("")
+        
+        self.vram_card.set_value(stats.memory_used_mb)
+        self.vram_card.set_subtitle(f"of {stats.memory_total_mb} MB")
+        
+        # Utilization bars
+        self.gpu_util.set_value(stats.gpu_utilization_percent / 100.0)
+        self.vram_util.set_value(
+            stats.memory_used_mb / stats.memory_total_mb if stats.memory_total_mb > 0 else 0,
+            f"{stats.memory_used_mb}MB / {stats.memory_total_mb}MB"
+        )
+        
+        # Offsets
+        core_sign = "+" if offsets.core_offset_mhz >= 0 else ""
+        mem_sign = "+" if offsets.memory_offset_mhz >= 0 else ""
+        self.core_offset_label.set_label(f"Core {core_sign}{offsets.core_offset_mhz} MHz")
+        self.mem_offset_label.set_label(f"Memory {mem_sign}{offsets.memory_offset_mhz} MHz")
+        
+        # Status chip
+        is_active = stats.gpu_utilization_percent > 50
+        self.status_chip.set_label("Active" if is_active else "Idle")
+        self.status_chip.remove_css_class("chip-active")
+        self.status_chip.remove_css_class("chip-idle")
+        self.status_chip.add_css_class("chip-active" if is_active else "chip-idle")
+    
     def _show_toast(self, message: str) -> None:
         """Show a toast notification via parent window."""
         parent = self.get_root()
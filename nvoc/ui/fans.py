@@ -20,7 +20,8 @@ import logging
 import threading
 import time
 
-from ..nvml_controller import SafetyLimits
+from ..nvml_controller import LIMITS, clamp
+from ..config import build_fan_curve_points, interpolate_fan_speed
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,8 @@ class FanState:
     Tracks fan control state.
     Separates commanded values from hardware-reported values.
     """
+    __slots__ = ("mode", "commanded_speed", "reported_speed", "current_temp", "curve", "_lock")
+    
     def __init__(self):
         self.mode: str = "auto"  # "auto", "manual", "curve"
         self.commanded_speed: Optional[int] = None  # What we asked for
@@ -70,6 +73,7 @@ class FanCurveDaemon:
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        self._curve_points = build_fan_curve_points({})
     
     def start(self, curve: Dict[int, int]):
         """Start the fan curve daemon."""
@@ -77,6 +81,7 @@ class FanCurveDaemon:
             self.stop()
         
         self.state.curve = curve.copy()
+        self._curve_points = build_fan_curve_points(self.state.curve)
         self._running = True
         self._stop_event.clear()
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
@@ -112,15 +117,11 @@ class FanCurveDaemon:
             from ..config import get_config
             config = get_config()
             
-            stats = self.controller.get_gpu_stats()
-            temp = stats.temperature_celsius
+            temp = self.controller.get_status().temperature_celsius
             prev_temp = self.state.current_temp
             self.state.current_temp = temp
             
-            curve = self.state.curve
-            sorted_temps = sorted(curve.keys())
-            
-            if not sorted_temps:
+            if not self._curve_points[0]:
                 return
             
             # Apply hysteresis: only change target if temp moved past hysteresis threshold
@@ -140,19 +141,7 @@ class FanCurveDaemon:
             self._last_curve_temp = temp
             
             # Interpolate fan speed from curve
-            if temp <= sorted_temps[0]:
-                target_speed = curve[sorted_temps[0]]
-            elif temp >= sorted_temps[-1]:
-                target_speed = curve[sorted_temps[-1]]
-            else:
-                target_speed = curve[sorted_temps[0]]
-                for i in range(len(sorted_temps) - 1):
-                    t1, t2 = sorted_temps[i], sorted_temps[i + 1]
-                    if t1 <= temp <= t2:
-                        s1, s2 = curve[t1], curve[t2]
-                        # Linear interpolation
-                        target_speed = s1 + (s2 - s1) * (temp - t1) / (t2 - t1)
-                        break
+            target_speed = interpolate_fan_speed(self._curve_points, temp)
             
             # Apply min floor
             target_speed = max(config.min_fan_speed_percent, int(target_speed))
@@ -365,8 +354,8 @@ class FanCurveEditor(Gtk.DrawingArea):
                 temp = int(20 + (x - padding) / graph_width * 80)
                 speed = int(100 - (y - padding) / graph_height * 100)
                 
-                temp = max(20, min(100, temp))
-                speed = max(SafetyLimits.MIN_FAN_SPEED_PERCENT, min(100, speed))
+                temp = clamp(temp, 20, 100)
+                speed = clamp(speed, LIMITS.MIN_FAN_SPEED_PERCENT, 100)
                 
                 self._curve_points.append((temp, speed))
                 self._selected_point = len(self._curve_points) - 1
@@ -409,8 +398,8 @@ class FanCurveEditor(Gtk.DrawingArea):
         temp = int(20 + (x - padding) / graph_width * 80)
         speed = int(100 - (y - padding) / graph_height * 100)
         
-        temp = max(20, min(100, temp))
-        speed = max(SafetyLimits.MIN_FAN_SPEED_PERCENT, min(100, speed))
+        temp = clamp(temp, 20, 100)
+        speed = clamp(speed, LIMITS.MIN_FAN_SPEED_PERCENT, 100)
         
         self._curve_points[self._selected_point] = (temp, speed)
         self._notify_change()
@@ -561,7 +550,7 @@ class FansPage(Gtk.Box):
         # Manual speed slider
         self.manual_slider = Gtk.Scale.new_with_range(
             Gtk.Orientation.HORIZONTAL,
-            SafetyLimits.MIN_FAN_SPEED_PERCENT,
+            LIMITS.MIN_FAN_SPEED_PERCENT,
             100,
             1
         )
@@ -571,7 +560,7 @@ class FansPage(Gtk.Box):
         self.manual_slider.set_margin_start(24)
         self.manual_slider.set_margin_end(24)
         
-        self.manual_slider.add_mark(SafetyLimits.MIN_FAN_SPEED_PERCENT, Gtk.PositionType.BOTTOM, "Min Safe")
+        self.manual_slider.add_mark(LIMITS.MIN_FAN_SPEED_PERCENT, Gtk.PositionType.BOTTOM, "Min Safe")
         self.manual_slider.add_mark(50, Gtk.PositionType.BOTTOM, None)
         self.manual_slider.add_mark(100, Gtk.PositionType.BOTTOM, "100%")
         
@@ -779,7 +768,7 @@ class FansPage(Gtk.Box):
         
         self._updating = True
         try:
-            stats = self.controller.get_gpu_stats()
+            stats = self.controller.get_status()
             
             # Update state with reported values
             self._fan_state.reported_speed = stats.fan_speed_percent
@@ -12,7 +12,7 @@ from gi.repository import Gtk, Adw, GLib
 from typing import Optional, Callable
 import logging
 
-from ..nvml_controller import SafetyLimits
+from ..nvml_controller import LIMITS
 from ..narratives import get_narrative
 
 logger = logging.getLogger(__name__)
@@ -429,8 +429,8 @@ class OverclockPage(Gtk.Box):
         clocks_desc = Gtk.Label(
             label=(
                 f"Offset the GPU clocks from their default values. "
-                f"Safety limited to ±{SafetyLimits.MAX_CORE_CLOCK_OFFSET_MHZ}MHz core, "
-                f"±{SafetyLimits.MAX_MEMORY_CLOCK_OFFSET_MHZ}MHz memory.\n"
+                f"Safety limited to ±{LIMITS.MAX_CORE_CLOCK_OFFSET_MHZ}MHz core, "
+                f"±{LIMITS.MAX_MEMORY_CLOCK_OFFSET_MHZ}MHz memory.\n"
                 f"Note: Offsets are only active under GPU load."
             )
         )
@@ -442,8 +442,8 @@ class OverclockPage(Gtk.Box):
         # Core clock slider
         self.core_slider = LabeledSlider(
             title="Core Clock Offset",
-            min_val=-SafetyLimits.MAX_CORE_CLOCK_OFFSET_MHZ,
-            max_val=SafetyLimits.MAX_CORE_CLOCK_OFFSET_MHZ,
+            min_val=-LIMITS.MAX_CORE_CLOCK_OFFSET_MHZ,
+            max_val=LIMITS.MAX_CORE_CLOCK_OFFSET_MHZ,
             step=5,
             unit=" MHz",
             format_func=lambda x: f"{x:+.0f}" if x != 0 else "0",
@@ -455,8 +455,8 @@ class OverclockPage(Gtk.Box):
         # Memory clock slider
         self.memory_slider = LabeledSlider(
             title="Memory Clock Offset",
-            min_val=-SafetyLimits.MAX_MEMORY_CLOCK_OFFSET_MHZ,
-            max_val=SafetyLimits.MAX_MEMORY_CLOCK_OFFSET_MHZ,
+            min_val=-LIMITS.MAX_MEMORY_CLOCK_OFFSET_MHZ,
+            max_val=LIMITS.MAX_MEMORY_CLOCK_OFFSET_MHZ,
             step=50,
             unit=" MHz",
             format_func=lambda x: f"{x:+.0f}" if x != 0 else "0",
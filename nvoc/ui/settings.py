@@ -10,7 +10,7 @@ gi.require_version('Adw', '1')
 from gi.repository import Gtk, Adw, GLib
 import logging
 
-from ..config import get_config, save_config
+from ..config import get_config, get_config_manager
 
 logger = logging.getLogger(__name__)
 
@@ -184,7 +184,7 @@ class SettingsPage(Gtk.Box):
         if selected < len(intervals):
             interval = intervals[selected]
             self.config.monitoring_interval_ms = interval
-            save_config(self.config)
+            get_config_manager().save_debounced(self.config)
             
             # Apply dynamic update
             if self.window:
@@ -192,11 +192,11 @@ class SettingsPage(Gtk.Box):
     
     def _on_startup_changed(self, switch, param) -> None:
         self.config.apply_default_profile_on_start = switch.get_active()
-        save_config(self.config)
+        get_config_manager().save_debounced(self.config)
     
     def _on_tray_changed(self, switch, param) -> None:
         self.config.minimize_to_tray = switch.get_active()
-        save_config(self.config)
+        get_config_manager().save_debounced(self.config)
     
     def _on_export_diagnostics(self, btn) -> None:
         """Export a diagnostics bundle."""
@@ -645,7 +645,7 @@ class StressPage(Adw.Bin):
         
     def update_stats(self):
         try:
-            stats = self.controller.get_gpu_stats()
+            stats = self.controller.get_status()
             self.temp_graph.add_value(stats.temperature_celsius)
             self.power_graph.add_value(stats.power_draw_watts)
             
@@ -33,6 +33,7 @@ class MainWindow(Adw.ApplicationWindow):
         
         self.controller = controller
         self._update_source_id = None
+        self._push_pending = False
         
         config = get_config()
         
@@ -186,12 +187,33 @@ class MainWindow(Adw.ApplicationWindow):
             GLib.source_remove(self._update_source_id)
             self._update_source_id = None
         
-        self._update_source_id = GLib.timeout_add(
-            interval_ms,
-            self._update_stats
-        )
+        # Sample NVML off the main loop and let each new sample drive the UI;
+        # clock/P-state events wake the sampler early. Without a sampler,
+        # fall back to polling on a UI timer.
+        try:
+            self.controller.start_background_sampler(
+                interval_ms / 1000.0, self._on_stats_sample
+            )
+        except Exception as e:
+            logger.warning(f"Background sampler unavailable, polling directly: {e}")
+            self._update_source_id = GLib.timeout_add(
+                interval_ms,
+                self._update_stats
+            )
         logger.info(f"Monitoring interval updated to {interval_ms}ms")
     
+    def _on_stats_sample(self, stats) -> None:
+        """Sampler-thread callback: schedule one UI refresh per burst of samples."""
+        if not self._push_pending:
+            self._push_pending = True
+            GLib.idle_add(self._on_stats_pushed)
+    
+    def _on_stats_pushed(self) -> bool:
+        """Main-loop side of _on_stats_sample()."""
+        self._push_pending = False
+        self._update_stats()
+        return False  # One-shot
+    
     def _on_close_request(self, window) -> bool:
         """Handle window close request (tray hide vs quit)."""
         config = get_config()
@@ -1046,6 +1068,10 @@ class MainWindow(Adw.ApplicationWindow):
         if self._update_source_id:
             GLib.source_remove(self._update_source_id)
             self._update_source_id = None
+        if self.controller:
+            # Don't block the close; controller.shutdown() joins the thread
+            # before NVML is shut down
+            self.controller.stop_background_sampler(wait=False)
             
         # Cleanup pages
         if hasattr(self, 'stress_page'):